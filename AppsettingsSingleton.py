@@ -1,78 +1,101 @@
 import json
+import logging
 import os
-from typing import List
+import threading
+from typing import Iterable, List, NamedTuple, Tuple
 
 from FileLoader import LoadFileContent
+from SettingsSchema import Field, SettingsSchema
 
 
-class AppSettingsSingleton:
+class SettingsSnapshot(NamedTuple):
+    source_directory: str
+    failure_folder: str
+    video_extension: Tuple[str, ...]
+    delete_processed: bool
+    retry_limit: int
+    retry_wait_ms: int
+    log_level: str
 
-    _SINGLE_INSTANCE = None
 
-    class _AppSettings:
-        _SOURCE_DIRECTORY_DEFAULT = "."
+def _resolve_directory(directory: str) -> str:
+    if os.path.isabs(directory):
+        return directory
+    return os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", directory))
 
-        _FAILURE_FOLDER_DEFAULT = "./failure"
 
-        _VIDEO_EXTENSIONS_DEFAULT = ["avi", "wmv", "mp4", "mkv"]
+class AppSettingsSingleton:
 
-        _DELETE_PROCESSED_DEFAULT = False
+    _SINGLE_INSTANCE = None
 
-        _RETRY_LIMIT_DEFAULT = 5
-        _RETRY_LIMIT_MIN = 0
-        _RETRY_LIMIT_MAX = 100
+    class _AppSettings:
+        _SCHEMA = SettingsSchema([
+            Field("SourceDirectory", "source_directory", str, ".", convert=_resolve_directory),
+            Field("FailureFolder", "failure_folder", str, "./failure", convert=_resolve_directory),
+            Field("VideoFileExtensions", "video_extension", list, ["avi", "wmv", "mp4", "mkv"], item_kind=str,
+                  convert=tuple),
+            Field("DeletedProcessed", "delete_processed", bool, False),
+            Field("RetryLimit", "retry_limit", int, 5, minimum=0, maximum=100),
+            Field("RetryWaitMs", "retry_wait_ms", int, 60000, minimum=0, maximum=600000),
+            Field("LogLevel", "log_level", str, "INFO", choices=["TRACE", "DEBUG", "INFO", "WARN", "ERROR"]),
+        ])
 
-        _RETRY_WAIT_MS_DEFAULT = 60000
-        _RETRY_WAIT_MS_MIN = 0
-        _RETRY_WAIT_MS_MAX = 600000
+        @property
+        def snapshot(self) -> SettingsSnapshot:
+            return self._snapshot
 
-        _LOG_LEVEL_DEFAULT = "INFO"
-        _LOG_LEVEL_VALID_LEVELS = ["TRACE", "DEBUG", "INFO", "WARN", "ERROR"]
+        @property
+        def validation_errors(self) -> List[str]:
+            return list(self._validation_errors)
 
         @property
         def source_directory(self):
-            return self._source_directory
+            return self._snapshot.source_directory
 
         @property
         def failure_folder(self):
-            return self._failure_folder
+            return self._snapshot.failure_folder
 
         @property
         def video_extension(self):
-            return self._video_extensions
+            return list(self._snapshot.video_extension)
 
         @property
         def delete_processed(self):
-            return self._delete_processed
+            return self._snapshot.delete_processed
 
         @property
         def retry_limit(self):
-            return self._retry_limit
+            return self._snapshot.retry_limit
 
         @property
         def retry_wait_ms(self):
-            return self._retry_wait_ms
+            return self._snapshot.retry_wait_ms
 
         @property
         def log_level(self):
-            return self._log_level
+            return self._snapshot.log_level
 
-        def __init__(self, config: str) -> None:
+        _SNAPSHOT_CACHE_VERSION = 3
+        _SNAPSHOT_FIELDS = set(SettingsSnapshot._fields)
+        _SNAPSHOT_CACHE_MODULE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+        def __init__(self, config: str, snapshot_cache: str=None) -> None:
             self._config = config
+            self._snapshot_cache = snapshot_cache
             self._config_content = None
             self._app_settings = None
 
-            self._source_directory = None
-            self._failure_folder = None
-            self._video_extensions = None
-            self._delete_processed = None
-            self._retry_limit = None
-            self._retry_wait_ms = None
-            self._log_level = None
+            self._snapshot = None
+            self._validation_errors = []
+            self._loaded_signature = None
+            self._reload_thread = None
+            self._reload_stop = threading.Event()
 
         def _read_appsettings_file(self) -> "_AppSettings":
             if os.path.isfile(self._config):
                 try:
+                    self._loaded_signature = self._config_signature()
                     self._config_content = LoadFileContent.load_json(self._config)
                 except PermissionError as e:
                     raise PermissionError(
@@ -85,6 +108,11 @@ class AppSettingsSingleton:
                         "The program config file at '{0}' could not be parsed due to a json decoding error. Please fix "
                         "resolve the problem and attempt to run the program again.".format(self._config), e.doc, e.pos
                     ).with_traceback(e.__traceback__)
+                if not isinstance(self._config_content, dict):
+                    raise ValueError(
+                        "The program config file at '{0}' must contain a json object. Please resolve the "
+                        "problem and attempt to run the program again.".format(self._config)
+                    )
             else:
                 raise FileNotFoundError (
                     "The program config file could not be found at '{0}'. Please resolve the "
@@ -93,81 +121,117 @@ class AppSettingsSingleton:
             return self
 
         def _set_values(self) -> "_AppSettings":
-            self._source_directory = self._get_directory(
-                self._config_content.get("SourceDirectory", None),
-                self._SOURCE_DIRECTORY_DEFAULT
-            )
+            values, self._validation_errors = self._SCHEMA.validate(self._config_content)
+            self._snapshot = SettingsSnapshot(**values)
 
-            self._failure_folder = self._get_directory(
-                self._config_content.get("FailureFolder", None),
-                self._FAILURE_FOLDER_DEFAULT
-            )
+            for error in self._validation_errors:
+                logging.info("Config file '{0}': {1}".format(self._config, error))
 
-            self._video_extensions = self._get_value(
-                self._config_content.get("VideoFileExtensions", None),
-                self._VIDEO_EXTENSIONS_DEFAULT
-            )
+            return self
 
-            self._delete_processed = self._get_value(
-                self._config_content.get("DeletedProcessed", None),
-                self._DELETE_PROCESSED_DEFAULT
-            )
+        def _load_settings(self) -> "_AppSettings":
+            if self._snapshot_cache and self._read_snapshot_cache():
+                return self
 
-            self._retry_limit = self._get_int(
-                self._config_content.get("RetryLimit", None),
-                self._RETRY_LIMIT_DEFAULT,
-                self._RETRY_LIMIT_MIN,
-                self._RETRY_LIMIT_MAX
-            )
+            self._read_appsettings_file()._set_values()
 
-            self._retry_wait_ms = self._get_int(
-                self._config_content.get("RetryWaitMs", None),
-                self._RETRY_WAIT_MS_DEFAULT,
-                self._RETRY_WAIT_MS_MIN,
-                self._RETRY_WAIT_MS_MAX
-            )
-
-            self._log_level = self._get_level(
-                self._config_content.get("LogLevel"),
-                self._LOG_LEVEL_DEFAULT,
-                self._LOG_LEVEL_VALID_LEVELS
-            )
+            if self._snapshot_cache and self._loaded_signature is not None:
+                self._write_snapshot_cache()
 
             return self
 
-        def _get_directory(self, value_from_config: str, default_value: str) -> str:
-            if self._is_both_matching_types(value_from_config, default_value):
-                if os.path.isabs(value_from_config):
-                    return value_from_config
-                else:
-                    return os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", value_from_config))
-            else:
-                return os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", default_value))
-
-        def _get_int(self, value_from_config: int, default_value: int, minimum: int, maximum: int) -> int:
-            if self._is_both_matching_types(value_from_config, default_value):
-                return sorted([minimum, value_from_config, maximum])[1]
-            else:
-                return default_value
-
-        def _get_value(self, value_from_config, default_value):
-            if self._is_both_matching_types(value_from_config, default_value):
-                return value_from_config
-            else:
-                return default_value
+        def _snapshot_cache_key(self, signature):
+            return [
+                self._SNAPSHOT_CACHE_VERSION,
+                os.path.abspath(self._config),
+                list(signature),
+                self._SNAPSHOT_CACHE_MODULE_DIRECTORY
+            ]
 
-        def _get_level(self, value_from_config: str, default_value: str, valids: List[str]):
-            if self._is_both_matching_types(value_from_config, default_value):
-                if value_from_config in valids:
-                    return value_from_config
-            return default_value
+        def _read_snapshot_cache(self) -> bool:
+            signature = self._config_signature()
+            if signature is None:
+                return False
+
+            try:
+                with open(self._snapshot_cache, "rb") as cache_file:
+                    cache = LoadFileContent.loads(cache_file.read())
+                if not isinstance(cache, dict) or cache.get("key") != self._snapshot_cache_key(signature):
+                    return False
+                values = cache["snapshot"]
+                if not isinstance(values, dict) or values.keys() != self._SNAPSHOT_FIELDS or not isinstance(
+                        cache["errors"], list):
+                    return False
+                values["video_extension"] = tuple(values["video_extension"])
+                snapshot = SettingsSnapshot(**values)
+                validation_errors = list(map(str, cache["errors"]))
+            except (OSError, ValueError, KeyError, TypeError):
+                return False
+
+            self._snapshot = snapshot
+            self._validation_errors = validation_errors
+            self._loaded_signature = signature
+            return True
+
+        def _write_snapshot_cache(self) -> None:
+            temporary_cache = "{0}.{1}.tmp".format(self._snapshot_cache, os.getpid())
+            try:
+                with open(temporary_cache, "w") as cache_file:
+                    json.dump(
+                        dict(
+                            key=self._snapshot_cache_key(self._loaded_signature),
+                            snapshot=self._snapshot._asdict(),
+                            errors=self._validation_errors
+                        ),
+                        cache_file
+                    )
+                os.replace(temporary_cache, self._snapshot_cache)
+            except OSError as e:
+                logging.info("The settings snapshot cache '{0}' could not be written: {1}".format(
+                    self._snapshot_cache, e
+                ))
+
+        def reload(self) -> bool:
+            try:
+                reloaded = type(self)(self._config, self._snapshot_cache)._load_settings()
+            except (OSError, ValueError) as e:
+                logging.info("Keeping the current settings, the config file could not be reloaded: {0}".format(e))
+                return False
+
+            self._snapshot = reloaded._snapshot
+            self._validation_errors = reloaded._validation_errors
+            self._loaded_signature = reloaded._loaded_signature
+            return True
+
+        def start_hot_reload(self, interval_seconds: float=1.0) -> "_AppSettings":
+            if self._reload_thread is None:
+                self._reload_stop.clear()
+                self._reload_thread = threading.Thread(
+                    target=self._watch_config, args=(interval_seconds,), name="AppSettingsReload", daemon=True
+                )
+                self._reload_thread.start()
+            return self
 
-        @staticmethod
-        def _is_both_matching_types(value_from_config, default_value):
-            if type(default_value) is list and type(value_from_config) is list:
-                return all(isinstance(value, type(default_value[0])) for value in value_from_config)
-            else:
-                return type(value_from_config) == type(default_value)
+        def stop_hot_reload(self) -> None:
+            if self._reload_thread is not None:
+                self._reload_stop.set()
+                self._reload_thread.join()
+                self._reload_thread = None
+
+        def _watch_config(self, interval_seconds: float) -> None:
+            while not self._reload_stop.wait(interval_seconds):
+                signature = self._config_signature()
+                if signature is not None and signature != self._loaded_signature:
+                    logging.info("Config file '{0}' changed, reloading settings.".format(self._config))
+                    if not self.reload():
+                        self._loaded_signature = signature
+
+        def _config_signature(self):
+            try:
+                stat = os.stat(self._config)
+            except OSError:
+                return None
+            return stat.st_mtime_ns, stat.st_size
 
         def __str__(self):
             configs = self._config_values_header()
@@ -185,17 +249,52 @@ class AppSettingsSingleton:
                 "------------------------------"
             ]
 
-    def __new__(cls, config: str=None):
+    def __new__(cls, config: str=None, snapshot_cache: str=None):
         if not cls._SINGLE_INSTANCE:
 
             cls._SINGLE_INSTANCE = (
-                cls._AppSettings(config)
-                    ._read_appsettings_file()
-                    ._set_values()
+                cls._AppSettings(config, snapshot_cache)
+                    ._load_settings()
             )
 
         return cls._SINGLE_INSTANCE
 
+    @classmethod
+    def validate_configs(cls, configs: Iterable[dict]) -> List[Tuple[SettingsSnapshot, List[str]]]:
+        return [
+            (SettingsSnapshot(**values), errors)
+            for values, errors in cls._AppSettings._SCHEMA.validate_many(configs)
+        ]
+
     @classmethod
     def delete_instance_for_tests(cls):
+        if cls._SINGLE_INSTANCE:
+            cls._SINGLE_INSTANCE.stop_hot_reload()
         cls._SINGLE_INSTANCE = None
+
+
+if __name__ == "__main__":
+    import tempfile
+    import timeit
+
+    benchmark_directory = tempfile.mkdtemp()
+    benchmark_config = os.path.join(benchmark_directory, "appsettings.json")
+    benchmark_cache = os.path.join(benchmark_directory, "appsettings.snapshot")
+    with open(benchmark_config, "w") as config_file:
+        json.dump(dict(SourceDirectory="/media", FailureFolder="/media/failure", RetryLimit=3), config_file)
+
+    def load(snapshot_cache=None):
+        AppSettingsSingleton.delete_instance_for_tests()
+        AppSettingsSingleton(benchmark_config, snapshot_cache)
+
+    load(benchmark_cache)
+    loads = 20000
+    cold = timeit.timeit(load, number=loads)
+    warm = timeit.timeit(lambda: load(benchmark_cache), number=loads)
+
+    print("cold (parse and validate JSON): {0:.1f} us per load".format(cold / loads * 1e6))
+    print("warm (cached snapshot):         {0:.1f} us per load".format(warm / loads * 1e6))
+
+    os.remove(benchmark_cache)
+    os.remove(benchmark_config)
+    os.rmdir(benchmark_directory)
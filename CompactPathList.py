@@ -0,0 +1,106 @@
+import os
+from array import array
+from typing import Iterable, Iterator, List
+
+
+class CompactPathList:
+
+    def __init__(self, paths: Iterable[str]=()):
+        self._directories = []
+        self._directory_ids = {}
+
+        self._entry_directories = array("I")
+        self._name_offsets = array("Q", [0])
+        self._names = bytearray()
+
+        for path in paths:
+            self.append(path)
+
+    def append(self, path: str) -> int:
+        directory, name = os.path.split(path)
+        return self.add(directory, name)
+
+    def add(self, directory: str, name: str) -> int:
+        directory_id = self._directory_ids.get(directory)
+        if directory_id is None:
+            directory_id = self._directory_ids[directory] = len(self._directories)
+            self._directories.append(directory)
+
+        self._entry_directories.append(directory_id)
+        self._names += os.fsencode(name)
+        self._name_offsets.append(len(self._names))
+
+        return len(self._entry_directories) - 1
+
+    def add_directory(self, directory: str, names: Iterable[str]) -> None:
+        for name in names:
+            self.add(directory, name)
+
+    def name(self, index: int) -> str:
+        return os.fsdecode(bytes(self._names[self._name_offsets[index]:self._name_offsets[index + 1]]))
+
+    def directory(self, index: int) -> str:
+        return self._directories[self._entry_directories[index]]
+
+    def paths_at(self, indexes: Iterable[int]) -> List[str]:
+        return [self[index] for index in indexes]
+
+    def files_of_specific_types(self, file_extensions: List[str]) -> Iterator[str]:
+        suffixes = tuple(os.fsencode("." + extension.lstrip(".").lower()) for extension in file_extensions)
+
+        for index in range(len(self)):
+            if self._names[self._name_offsets[index]:self._name_offsets[index + 1]].lower().endswith(suffixes):
+                yield self[index]
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CompactPathList index out of range")
+        return os.path.join(self.directory(index), self.name(index))
+
+    def __len__(self) -> int:
+        return len(self._entry_directories)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield os.path.join(self.directory(index), self.name(index))
+
+    def __sizeof__(self):
+        return (
+            object.__sizeof__(self)
+            + self._entry_directories.__sizeof__()
+            + self._name_offsets.__sizeof__()
+            + self._names.__sizeof__()
+            + self._directories.__sizeof__()
+            + sum(directory.__sizeof__() for directory in self._directories)
+            + self._directory_ids.__sizeof__()
+        )
+
+
+if __name__ == "__main__":
+    import tracemalloc
+
+    def synthetic_tree():
+        for share in range(10):
+            for show in range(100):
+                directory = "/mnt/media/share_{0:02d}/library/television/show_{1:03d}/season_01".format(share, show)
+                for episode in range(200):
+                    yield directory, "episode_{0:03d}.mkv".format(episode)
+
+    tracemalloc.start()
+    path_strings = [os.path.join(directory, name) for directory, name in synthetic_tree()]
+    list_memory = tracemalloc.get_traced_memory()[0]
+    del path_strings
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    compact_paths = CompactPathList()
+    for directory, name in synthetic_tree():
+        compact_paths.add(directory, name)
+    compact_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print("{0} paths".format(len(compact_paths)))
+    print("list of strings: {0:.1f} MB".format(list_memory / 1024 / 1024))
+    print("CompactPathList: {0:.1f} MB ({1:.1%} of list)".format(compact_memory / 1024 / 1024, compact_memory / list_memory))
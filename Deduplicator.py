@@ -0,0 +1,134 @@
+import hashlib
+import logging
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from FileRecord import FileRecord
+
+
+def _partial_hash(path: str, block_size: int) -> Tuple[str, Optional[bytes]]:
+    digest = hashlib.blake2b()
+    try:
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                return path, digest.digest()
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                if size <= 2 * block_size:
+                    digest.update(mapped_file)
+                else:
+                    digest.update(mapped_file[:block_size])
+                    digest.update(mapped_file[size - block_size:])
+    except (OSError, ValueError) as e:
+        logging.info("File '{0}' could not be hashed: {1}".format(path, e))
+        return path, None
+
+    return path, digest.digest()
+
+
+def _full_hash(path: str, chunk_size: int=1024 * 1024) -> Tuple[str, Optional[bytes]]:
+    digest = hashlib.blake2b()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    try:
+        with open(path, "rb", buffering=0) as file:
+            for read_size in iter(lambda: file.readinto(buffer), 0):
+                digest.update(view[:read_size])
+    except OSError as e:
+        logging.info("File '{0}' could not be hashed: {1}".format(path, e))
+        return path, None
+
+    return path, digest.digest()
+
+
+class Deduplicator:
+
+    def __init__(self, workers: Optional[int]=None, block_size: int=64 * 1024):
+        self._workers = workers
+        self._block_size = block_size
+
+    def find_duplicates(self, files: Iterable[Union[str, FileRecord]]) -> List[List[str]]:
+        return self._find_duplicates(self._distinct_files(files))
+
+    def _find_duplicates(self, files: Iterable[Tuple[str, int]]) -> List[List[str]]:
+        candidates = [group for group in self._group_by_size(files).items() if len(group[1]) > 1]
+        if not candidates:
+            return []
+
+        executor = ProcessPoolExecutor(max_workers=self._workers) if self._workers != 0 else None
+        try:
+            duplicates, needs_full_hash = [], []
+            for size, paths in self._group_by_hash(executor, _partial_hash, candidates, self._block_size):
+                if size <= 2 * self._block_size:
+                    duplicates.append(paths)
+                else:
+                    needs_full_hash.append(paths)
+
+            duplicates.extend(
+                paths for _, paths in self._group_by_hash(executor, _full_hash, list(enumerate(needs_full_hash)))
+            )
+            return duplicates
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def unique_files(self, files: Iterable[Union[str, FileRecord]]) -> Iterator[str]:
+        files = list(self._distinct_files(files))
+        redundant = set()
+        for group in self._find_duplicates(files):
+            redundant.update(group[1:])
+
+        for path, _ in files:
+            if path not in redundant:
+                yield path
+
+    @staticmethod
+    def _distinct_files(files: Iterable[Union[str, FileRecord]]) -> Iterator[Tuple[str, int]]:
+        seen = set()
+
+        for file in files:
+            if isinstance(file, FileRecord):
+                path, size = file.path, file.size
+                identity = (file.device, file.inode) if file.inode else path
+            else:
+                path = str(file)
+                try:
+                    stat = os.stat(path)
+                except OSError as e:
+                    logging.info("File '{0}' could not be read: {1}".format(path, e))
+                    continue
+                size, identity = stat.st_size, (stat.st_dev, stat.st_ino)
+
+            if path in seen or identity in seen:
+                continue
+            seen.update((path, identity))
+            yield path, size
+
+    @staticmethod
+    def _group_by_size(files: Iterable[Tuple[str, int]]) -> Dict[int, List[str]]:
+        groups = {}
+
+        for path, size in files:
+            groups.setdefault(size, []).append(path)
+
+        return groups
+
+    @staticmethod
+    def _group_by_hash(executor, hash_function, groups: List[Tuple[Hashable, List[str]]],
+                       *args) -> List[Tuple[Hashable, List[str]]]:
+        keys = [key for key, paths in groups for _ in paths]
+        paths = [path for _, group_paths in groups for path in group_paths]
+        if executor is None:
+            hashes = (hash_function(path, *args) for path in paths)
+        else:
+            hashes = executor.map(hash_function, paths, *([arg] * len(paths) for arg in args))
+
+        regrouped = {}
+        for key, (path, digest) in zip(keys, hashes):
+            if digest is not None:
+                regrouped.setdefault((key, digest), []).append(path)
+
+        return [(key, group) for (key, _), group in regrouped.items() if len(group) > 1]
@@ -1,4 +1,6 @@
+import logging
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 
 class DirectoryWalker:
@@ -6,3 +8,113 @@ class DirectoryWalker:
     @staticmethod
     def walk_directory(root_directory):
         return os.walk(root_directory)
+
+    @staticmethod
+    def parallel_walk_directory(root_directory, workers: int=8, ordered: bool=False):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = {executor.submit(DirectoryWalker._list_directory, root_directory)}
+            listings = {}
+            walk_order = [root_directory]
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    directory, listing = future.result()
+                    if listing is not None:
+                        root, dirs, files, walkable_dirs = listing
+                        pending.update(
+                            executor.submit(DirectoryWalker._list_directory, os.path.join(root, walkable_dir))
+                            for walkable_dir in walkable_dirs
+                        )
+                        if not ordered:
+                            yield root, dirs, files
+
+                    if ordered:
+                        listings[directory] = listing
+
+                while ordered and walk_order and walk_order[-1] in listings:
+                    listing = listings.pop(walk_order.pop())
+                    if listing is not None:
+                        root, dirs, files, walkable_dirs = listing
+                        walk_order.extend(os.path.join(root, walkable_dir) for walkable_dir in reversed(walkable_dirs))
+                        yield root, dirs, files
+
+    @staticmethod
+    def scan_directory(root_directory):
+        pending_directories = [root_directory]
+
+        while pending_directories:
+            directory = pending_directories.pop()
+            sub_directories = []
+
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if DirectoryWalker._is_directory(entry):
+                            if not entry.is_symlink():
+                                sub_directories.append(entry.path)
+                        else:
+                            yield entry
+            except OSError as e:
+                logging.info("Directory '{0}' could not be scanned: {1}".format(directory, e))
+
+            pending_directories.extend(reversed(sub_directories))
+
+    @staticmethod
+    def _list_directory(directory: str):
+        dirs, files, walkable_dirs = [], [], []
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if DirectoryWalker._is_directory(entry):
+                        dirs.append(entry.name)
+                        if not entry.is_symlink():
+                            walkable_dirs.append(entry.name)
+                    else:
+                        files.append(entry.name)
+        except OSError as e:
+            logging.info("Directory '{0}' could not be scanned: {1}".format(directory, e))
+            return directory, None
+
+        return directory, (directory, dirs, files, walkable_dirs)
+
+    @staticmethod
+    def _is_directory(entry: os.DirEntry) -> bool:
+        try:
+            return entry.is_dir()
+        except OSError:
+            return False
+
+
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    import time
+
+    tree_root = tempfile.mkdtemp()
+    for top in range(20):
+        for middle in range(20):
+            leaf = os.path.join(tree_root, "d{0}".format(top), "d{0}".format(middle))
+            os.makedirs(leaf)
+            for file_number in range(25):
+                open(os.path.join(leaf, "f{0}.mkv".format(file_number)), "w").close()
+
+    try:
+        start = time.perf_counter()
+        file_count = sum(len(files) for _, _, files in DirectoryWalker.walk_directory(tree_root))
+        print("os.walk: {0} files in {1:.3f}s".format(file_count, time.perf_counter() - start))
+
+        for worker_count in (1, 2, 4, 8, 16):
+            for is_ordered in (False, True):
+                start = time.perf_counter()
+                file_count = sum(
+                    len(files) for _, _, files in
+                    DirectoryWalker.parallel_walk_directory(tree_root, worker_count, is_ordered)
+                )
+                print("parallel (workers={0}, ordered={1}): {2} files in {3:.3f}s".format(
+                    worker_count, is_ordered, file_count, time.perf_counter() - start
+                ))
+    finally:
+        shutil.rmtree(tree_root)
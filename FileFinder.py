@@ -1,30 +1,118 @@
 import logging
 import os
-from typing import List
+from array import array
+from typing import Iterator, List, Union
 
+from CompactPathList import CompactPathList
 from DirectoryWalker import DirectoryWalker
+from FileRecord import FileRecord
+from FileWatcher import FileWatcher
+from ScanIndex import ScanDelta, ScanIndex
 
 
 class FileFinder(object):
 
     def __init__(self):
-        self._files_in_directory = []
+        self._files_in_directory = CompactPathList()
+        self._files_by_extension = {}
 
-    def find_all_files_in_directory(self, search_directory: str) -> "FileFinder":
+    def find_all_files_in_directory(self, search_directory: str, workers: int=1, ordered: bool=True) -> "FileFinder":
         logging.info("Compiling list of all files in the '{0}' directory.".format(search_directory))
 
         if self._is_directory_exist(search_directory):
-            for root, _, files in DirectoryWalker.walk_directory(search_directory):
+            for root, _, files in self._walk(search_directory, workers, ordered):
                 for file in files:
-                    self._files_in_directory.append(os.path.join(root, file))
+                    self._add_file(root, file)
             return self
 
         else:
             logging.info("Directory '{0}' does not exist.".format(search_directory))
             raise NotADirectoryError
 
+    def find_changes_in_directory(self, search_directory: str, scan_index: ScanIndex) -> ScanDelta:
+        logging.info("Updating indexed list of files in the '{0}' directory.".format(search_directory))
+
+        if self._is_directory_exist(search_directory):
+            delta = scan_index.scan(search_directory)
+            self._files_in_directory = CompactPathList()
+            self._files_by_extension = {}
+            for file in scan_index.files(search_directory):
+                self._add_file(*os.path.split(file))
+            return delta
+
+        else:
+            logging.info("Directory '{0}' does not exist.".format(search_directory))
+            raise NotADirectoryError
+
     def get_files_of_specific_types(self, file_extensions: List[str]) -> List[str]:
-        return list(filter(lambda file: file.endswith(tuple(file_extensions)), self._files_in_directory))
+        matching_files = []
+
+        for extension in dict.fromkeys(map(self._normalize_extension, file_extensions)):
+            bucket = self._files_in_directory.paths_at(self._files_by_extension.get(extension.rpartition(".")[2], ()))
+            if "." in extension:
+                matching_files.extend(file for file in bucket if file.lower().endswith("." + extension))
+            else:
+                matching_files.extend(bucket)
+
+        return matching_files
+
+    def stream_files_of_specific_types(self, search_directory: str, file_extensions: List[str],
+                                       with_metadata: bool=False) -> Iterator[Union[str, FileRecord]]:
+        logging.info("Streaming files of types {0} from the '{1}' directory.".format(file_extensions, search_directory))
+
+        if self._is_directory_exist(search_directory):
+            return self._scan_for_files(
+                search_directory,
+                tuple("." + self._normalize_extension(extension) for extension in file_extensions),
+                with_metadata
+            )
+
+        else:
+            logging.info("Directory '{0}' does not exist.".format(search_directory))
+            raise NotADirectoryError
+
+    def watch_files_of_specific_types(self, search_directory: str, file_extensions: List[str],
+                                      settle_seconds: float=2.0, poll_interval: float=1.0) -> FileWatcher:
+        logging.info("Watching for files of types {0} in the '{1}' directory.".format(file_extensions, search_directory))
+
+        if self._is_directory_exist(search_directory):
+            return FileWatcher(search_directory, file_extensions, settle_seconds, poll_interval)
+
+        else:
+            logging.info("Directory '{0}' does not exist.".format(search_directory))
+            raise NotADirectoryError
+
+    def _add_file(self, directory: str, file: str) -> None:
+        index = self._files_in_directory.add(directory, file)
+        self._files_by_extension.setdefault(self._extension_of(file), array("I")).append(index)
+
+    @staticmethod
+    def _normalize_extension(extension: str) -> str:
+        return extension.lstrip(".").lower()
+
+    @staticmethod
+    def _extension_of(file: str) -> str:
+        return file.rpartition(".")[2].lower() if "." in file else ""
+
+    @staticmethod
+    def _walk(search_directory: str, workers: int, ordered: bool):
+        if workers > 1:
+            return DirectoryWalker.parallel_walk_directory(search_directory, workers, ordered)
+        return DirectoryWalker.walk_directory(search_directory)
+
+    @staticmethod
+    def _scan_for_files(search_directory: str, file_extensions: tuple,
+                        with_metadata: bool) -> Iterator[Union[str, FileRecord]]:
+        for entry in DirectoryWalker.scan_directory(search_directory):
+            if entry.name.lower().endswith(file_extensions):
+                if not with_metadata:
+                    yield entry.path
+                    continue
+
+                try:
+                    yield FileRecord.from_dir_entry(entry)
+                except OSError as e:
+                    logging.info("File '{0}' could not be read: {1}".format(entry.path, e))
 
     @staticmethod
     def _is_directory_exist(directory: str) -> bool:
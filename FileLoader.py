@@ -1,9 +1,283 @@
 import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Iterator, NamedTuple, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+
+class _FileContentCache:
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def configure(self, max_entries: int, max_bytes: int) -> None:
+        with self._lock:
+            self._max_entries = max_entries
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def get(self, file_name: str, load) -> Any:
+        path = os.path.abspath(file_name)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(path)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        content = self.freeze(load(path))
+
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._bytes -= previous[0][1]
+            if signature[1] > self._max_bytes:
+                return content
+            self._entries[path] = (signature, content)
+            self._bytes += signature[1]
+            self._evict()
+
+        return content
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._entries), self._bytes,
+                             self._max_entries, self._max_bytes)
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self._max_entries or self._bytes > self._max_bytes):
+            (signature, _) = self._entries.popitem(last=False)[1]
+            self._bytes -= signature[1]
+            self._evictions += 1
+
+    @staticmethod
+    def freeze(content: Any) -> Any:
+        if isinstance(content, dict):
+            return MappingProxyType({key: _FileContentCache.freeze(value) for key, value in content.items()})
+        if isinstance(content, list):
+            return tuple(_FileContentCache.freeze(value) for value in content)
+        return content
 
 
 class LoadFileContent:
 
+    _CACHE = _FileContentCache(max_entries=128, max_bytes=64 * 1024 * 1024)
+
+    JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+    _STREAM_CHUNK_SIZE = 64 * 1024
+    _JSON_DECODER = json.JSONDecoder()
+    _WHITESPACE = " \t\n\r"
+
     @staticmethod
     def load_json(file_name: str) -> json:
+        with open(file_name, 'rb') as file_to_read:
+            return LoadFileContent.loads(file_to_read.read())
+
+    @staticmethod
+    def load_json_cached(file_name: str) -> json:
+        return LoadFileContent._CACHE.get(file_name, LoadFileContent.load_json)
+
+    @staticmethod
+    def configure_cache(max_entries: int=128, max_bytes: int=64 * 1024 * 1024) -> None:
+        LoadFileContent._CACHE.configure(max_entries, max_bytes)
+
+    @staticmethod
+    def clear_cache() -> None:
+        LoadFileContent._CACHE.clear()
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        return LoadFileContent._CACHE.info()
+
+    @staticmethod
+    def load_json_mmap(file_name: str) -> json:
+        with open(file_name, 'rb') as file_to_read:
+            if os.fstat(file_to_read.fileno()).st_size == 0:
+                return LoadFileContent.loads(b"")
+
+            with mmap.mmap(file_to_read.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                with memoryview(mapped_file) as mapped_view:
+                    return LoadFileContent.loads(mapped_view)
+
+    @staticmethod
+    def iter_json_lines(file_name: str) -> Iterator[Any]:
+        with open(file_name, 'rb') as file_to_read:
+            if os.fstat(file_to_read.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(file_to_read.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                for line in iter(mapped_file.readline, b""):
+                    if line.strip():
+                        yield LoadFileContent.loads(line)
+
+    @staticmethod
+    def iter_json_array(file_name: str) -> Iterator[Any]:
+        decoder = LoadFileContent._JSON_DECODER
+        whitespace = LoadFileContent._WHITESPACE
+        read_size = LoadFileContent._STREAM_CHUNK_SIZE
+
         with open(file_name, 'r') as file_to_read:
-            return json.load(file_to_read)
+            buffer, position, end_of_file = LoadFileContent._skip_in_file(file_to_read, "", 0)
+
+            if end_of_file or buffer[position] != "[":
+                raise json.decoder.JSONDecodeError("Expecting a top level JSON array", buffer, position)
+            position += 1
+            expecting_item = False
+
+            while True:
+                buffer, position, at_end = LoadFileContent._skip_in_file(file_to_read, buffer, position)
+                end_of_file = end_of_file or at_end
+
+                if at_end:
+                    raise json.decoder.JSONDecodeError("Expecting value", buffer, position)
+                if buffer[position] == "]" and not expecting_item:
+                    LoadFileContent._expect_end_of_file(file_to_read, buffer, position + 1)
+                    return
+
+                try:
+                    item, item_end = decoder.raw_decode(buffer, position)
+                    after_item = LoadFileContent._skip(buffer, item_end, whitespace)
+                    complete = end_of_file or after_item < len(buffer) and buffer[after_item] in ",]"
+                except json.decoder.JSONDecodeError:
+                    if end_of_file:
+                        raise
+                    complete = False
+
+                if not complete:
+                    chunk = file_to_read.read(read_size)
+                    end_of_file = not chunk
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    read_size *= 2
+                    continue
+
+                yield item
+                read_size = LoadFileContent._STREAM_CHUNK_SIZE
+
+                if after_item < len(buffer) and buffer[after_item] == ",":
+                    position = after_item + 1
+                    expecting_item = True
+                elif after_item < len(buffer) and buffer[after_item] == "]":
+                    LoadFileContent._expect_end_of_file(file_to_read, buffer, after_item + 1)
+                    return
+                else:
+                    raise json.decoder.JSONDecodeError("Expecting ',' delimiter", buffer, after_item)
+
+    @staticmethod
+    def _skip_in_file(file_to_read, buffer: str, position: int) -> Tuple[str, int, bool]:
+        while True:
+            position = LoadFileContent._skip(buffer, position, LoadFileContent._WHITESPACE)
+            if position < len(buffer):
+                return buffer, position, False
+
+            chunk = file_to_read.read(LoadFileContent._STREAM_CHUNK_SIZE)
+            if not chunk:
+                return buffer, position, True
+            buffer, position = chunk, 0
+
+    @staticmethod
+    def _expect_end_of_file(file_to_read, buffer: str, position: int) -> None:
+        buffer, position, at_end = LoadFileContent._skip_in_file(file_to_read, buffer, position)
+        if not at_end:
+            raise json.decoder.JSONDecodeError("Extra data", buffer, position)
+
+    @staticmethod
+    def loads(content) -> json:
+        if orjson is not None:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+
+        if not isinstance(content, (str, bytes)):
+            content = bytes(content)
+        return json.loads(content)
+
+    @staticmethod
+    def _skip(buffer: str, position: int, characters: str) -> int:
+        while position < len(buffer) and buffer[position] in characters:
+            position += 1
+        return position
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+    import tracemalloc
+
+    benchmark_directory = tempfile.mkdtemp()
+    manifest_json = os.path.join(benchmark_directory, "manifest.json")
+    manifest_jsonl = os.path.join(benchmark_directory, "manifest.jsonl")
+    records = [
+        dict(path="/mnt/media/show_{0:04d}/episode_{1:03d}.mkv".format(number // 100, number % 100),
+             size=number * 1024, retries=number % 5)
+        for number in range(300000)
+    ]
+    with open(manifest_json, "w") as manifest:
+        json.dump(records, manifest)
+    with open(manifest_jsonl, "w") as manifest:
+        manifest.writelines(json.dumps(record) + "\n" for record in records)
+    del records
+
+    def measure(name, load):
+        start = time.perf_counter()
+        count = load()
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        load()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("{0:<34} {1:>8.0f} records/s  peak {2:>7.1f} MB".format(
+            name, count / elapsed, peak / 1024 / 1024
+        ))
+
+    def json_load():
+        with open(manifest_json) as manifest:
+            return len(json.load(manifest))
+
+    print("JSON backend: {0}".format(LoadFileContent.JSON_BACKEND))
+    measure("json.load", json_load)
+    measure("LoadFileContent.load_json", lambda: len(LoadFileContent.load_json(manifest_json)))
+    measure("LoadFileContent.load_json_mmap", lambda: len(LoadFileContent.load_json_mmap(manifest_json)))
+    measure("LoadFileContent.iter_json_array", lambda: sum(1 for _ in LoadFileContent.iter_json_array(manifest_json)))
+    measure("LoadFileContent.iter_json_lines", lambda: sum(1 for _ in LoadFileContent.iter_json_lines(manifest_jsonl)))
+
+    os.remove(manifest_json)
+    os.remove(manifest_jsonl)
+    os.rmdir(benchmark_directory)
@@ -0,0 +1,36 @@
+import os
+
+
+class FileRecord:
+
+    __slots__ = ("path", "size", "mtime", "inode", "device")
+
+    def __init__(self, path: str, size: int, mtime: float, inode: int, device: int=0):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.inode = inode
+        self.device = device
+
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry) -> "FileRecord":
+        stat = entry.stat()
+        return cls(entry.path, stat.st_size, stat.st_mtime, entry.inode(), stat.st_dev)
+
+    def __eq__(self, other):
+        if type(other) is not FileRecord:
+            return NotImplemented
+        return (self.path, self.size, self.mtime, self.inode, self.device) == (
+            other.path, other.size, other.mtime, other.inode, other.device
+        )
+
+    def __hash__(self):
+        return hash((self.path, self.size, self.mtime, self.inode, self.device))
+
+    def __repr__(self):
+        return "FileRecord(path={0!r}, size={1}, mtime={2}, inode={3}, device={4})".format(
+            self.path, self.size, self.mtime, self.inode, self.device
+        )
+
+    def __str__(self):
+        return self.path
@@ -0,0 +1,195 @@
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from DirectoryWalker import DirectoryWalker
+
+
+class FileWatcher:
+
+    _IN_MODIFY = 0x00000002
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_Q_OVERFLOW = 0x00004000
+    _IN_ISDIR = 0x40000000
+    _IN_NONBLOCK = os.O_NONBLOCK
+    _IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
+    _WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+    _EVENT_HEADER = struct.Struct("iIII")
+    _READ_SIZE = 64 * 1024
+
+    def __init__(self, search_directory: str, file_extensions: List[str], settle_seconds: float=2.0,
+                 poll_interval: float=1.0, use_inotify: bool=True):
+        self._search_directory = search_directory
+        self._file_extensions = tuple("." + extension.lstrip(".").lower() for extension in file_extensions)
+        self._settle_seconds = settle_seconds
+        self._poll_interval = poll_interval
+        self._use_inotify = use_inotify
+
+        self._pending_files = {}
+        self._stopped = False
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    def __iter__(self) -> Iterator[str]:
+        self._stopped = False
+        inotify_fd = self._open_inotify() if self._use_inotify else None
+
+        if inotify_fd is None:
+            logging.info("Polling the '{0}' directory for new files.".format(self._search_directory))
+            return self._poll()
+
+        logging.info("Watching the '{0}' directory for new files with inotify.".format(self._search_directory))
+        return self._watch_inotify(inotify_fd)
+
+    async def watch_async(self):
+        loop = asyncio.get_running_loop()
+        files = iter(self)
+        finished = object()
+
+        while True:
+            file = await loop.run_in_executor(None, next, files, finished)
+            if file is finished:
+                return
+            yield file
+
+    def _poll(self) -> Iterator[str]:
+        known_files = self._scan_matching_files()
+
+        while not self._stopped:
+            time.sleep(self._next_timeout())
+
+            current_files = self._scan_matching_files()
+            for path, signature in current_files.items():
+                if known_files.get(path) != signature:
+                    self._mark_changed(path)
+            known_files = current_files
+
+            yield from self._settled_files()
+
+    def _watch_inotify(self, inotify_fd: int) -> Iterator[str]:
+        watched_directories = {}
+
+        try:
+            self._add_watches(inotify_fd, self._search_directory, watched_directories, mark_existing=False)
+
+            while not self._stopped:
+                readable, _, _ = select.select([inotify_fd], [], [], self._next_timeout())
+                if readable:
+                    self._read_events(inotify_fd, watched_directories)
+
+                yield from self._settled_files()
+        finally:
+            os.close(inotify_fd)
+
+    def _read_events(self, inotify_fd: int, watched_directories: Dict[int, str]) -> None:
+        try:
+            buffer = os.read(inotify_fd, self._READ_SIZE)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(buffer):
+            watch_descriptor, mask, _, name_length = self._EVENT_HEADER.unpack_from(buffer, offset)
+            offset += self._EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset:offset + name_length].rstrip(b"\0"))
+            offset += name_length
+
+            if mask & self._IN_Q_OVERFLOW:
+                logging.info("Inotify event queue overflowed, rescanning '{0}'.".format(self._search_directory))
+                self._add_watches(inotify_fd, self._search_directory, watched_directories, mark_existing=True)
+                continue
+
+            directory = watched_directories.get(watch_descriptor)
+            if directory is None or not name:
+                continue
+
+            path = os.path.join(directory, name)
+            if mask & self._IN_ISDIR:
+                if mask & (self._IN_CREATE | self._IN_MOVED_TO):
+                    self._add_watches(inotify_fd, path, watched_directories, mark_existing=True)
+            elif name.lower().endswith(self._file_extensions):
+                self._mark_changed(path)
+
+    def _add_watches(self, inotify_fd: int, root_directory: str, watched_directories: Dict[int, str],
+                     mark_existing: bool) -> None:
+        for root, _, files in DirectoryWalker.walk_directory(root_directory):
+            watch_descriptor = self._libc.inotify_add_watch(inotify_fd, os.fsencode(root), self._WATCH_MASK)
+            if watch_descriptor < 0:
+                logging.info("Directory '{0}' could not be watched: {1}".format(
+                    root, os.strerror(ctypes.get_errno())
+                ))
+                continue
+            watched_directories[watch_descriptor] = root
+
+            if mark_existing:
+                for file in files:
+                    if file.lower().endswith(self._file_extensions):
+                        self._mark_changed(os.path.join(root, file))
+
+    def _mark_changed(self, path: str) -> None:
+        self._pending_files[path] = (self._file_signature(path), time.monotonic())
+
+    def _settled_files(self) -> Iterator[str]:
+        now = time.monotonic()
+
+        for path, (signature, last_change) in list(self._pending_files.items()):
+            current_signature = self._file_signature(path)
+            if current_signature is None:
+                del self._pending_files[path]
+            elif current_signature != signature:
+                self._pending_files[path] = (current_signature, now)
+            elif now - last_change >= self._settle_seconds:
+                del self._pending_files[path]
+                yield path
+
+    def _next_timeout(self) -> float:
+        if not self._pending_files:
+            return self._poll_interval
+
+        oldest_change = min(last_change for _, last_change in self._pending_files.values())
+        return max(0.0, min(self._poll_interval, oldest_change + self._settle_seconds - time.monotonic()))
+
+    def _scan_matching_files(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        return {
+            entry.path: self._file_signature(entry.path)
+            for entry in DirectoryWalker.scan_directory(self._search_directory)
+            if entry.name.lower().endswith(self._file_extensions)
+        }
+
+    def _open_inotify(self) -> Optional[int]:
+        if not sys.platform.startswith("linux"):
+            return None
+
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            inotify_fd = self._libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            logging.info("Inotify is unavailable, falling back to polling: {0}".format(e))
+            return None
+
+        if inotify_fd < 0:
+            logging.info("Inotify is unavailable, falling back to polling: {0}".format(
+                os.strerror(ctypes.get_errno())
+            ))
+            return None
+
+        return inotify_fd
+
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import os
+import shutil
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
+
+
+class JobResults:
+
+    def __init__(self):
+        self.processed = []
+        self.failed = []
+
+    def __str__(self):
+        return "{0} processed, {1} failed".format(len(self.processed), len(self.failed))
+
+
+class JobScheduler:
+
+    def __init__(self, process_file: Callable[[str], None], failure_folder: str, workers: int=4,
+                 retry_limit: int=5, retry_wait_ms: int=60000, delete_processed: bool=False,
+                 max_pending: Optional[int]=None, executor: Optional[Executor]=None):
+        self._process_file = process_file
+        self._failure_folder = failure_folder
+        self._workers = workers
+        self._retry_limit = retry_limit
+        self._retry_wait_seconds = retry_wait_ms / 1000
+        self._delete_processed = delete_processed
+        self._max_pending = max_pending or workers * 16
+        self._executor = executor
+
+    @classmethod
+    def from_settings(cls, process_file: Callable[[str], None], settings, workers: int=4,
+                      executor: Optional[Executor]=None) -> "JobScheduler":
+        return cls(
+            process_file,
+            settings.failure_folder,
+            workers=workers,
+            retry_limit=settings.retry_limit,
+            retry_wait_ms=settings.retry_wait_ms,
+            delete_processed=settings.delete_processed,
+            executor=executor
+        )
+
+    def process_files(self, files: Iterable[str]) -> JobResults:
+        return asyncio.run(self.run(files))
+
+    async def run(self, files: Iterable[str]) -> JobResults:
+        results = JobResults()
+        running = asyncio.Semaphore(self._workers)
+        pending = asyncio.Semaphore(self._max_pending)
+        executor = self._executor or ThreadPoolExecutor(max_workers=self._workers)
+
+        async def run_job(path: str) -> None:
+            try:
+                await self._run_job(path, executor, running, results)
+            finally:
+                pending.release()
+
+        try:
+            jobs = set()
+            for path in files:
+                await pending.acquire()
+                job = asyncio.ensure_future(run_job(path))
+                jobs.add(job)
+                job.add_done_callback(jobs.discard)
+
+            if jobs:
+                await asyncio.gather(*jobs)
+        finally:
+            if self._executor is None:
+                executor.shutdown()
+
+        logging.info("Finished processing files: {0}.".format(results))
+        return results
+
+    async def _run_job(self, path: str, executor: Executor, running: asyncio.Semaphore, results: JobResults) -> None:
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self._retry_limit + 1):
+            if attempt:
+                await asyncio.sleep(self._retry_wait_seconds)
+
+            async with running:
+                try:
+                    await loop.run_in_executor(executor, self._process_file, path)
+                except Exception as e:
+                    logging.info("Processing '{0}' failed on attempt {1} of {2}: {3}".format(
+                        path, attempt + 1, self._retry_limit + 1, e
+                    ))
+                    continue
+
+                if self._delete_processed:
+                    await loop.run_in_executor(executor, self._delete_file, path)
+
+            results.processed.append(path)
+            return
+
+        async with running:
+            await loop.run_in_executor(executor, self._move_to_failure_folder, path)
+        results.failed.append(path)
+
+    @staticmethod
+    def _delete_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logging.info("Processed file '{0}' could not be deleted: {1}".format(path, e))
+
+    def _move_to_failure_folder(self, path: str) -> None:
+        logging.info("Moving '{0}' to the failure folder '{1}'.".format(path, self._failure_folder))
+
+        try:
+            os.makedirs(self._failure_folder, exist_ok=True)
+            shutil.move(path, self._unused_failure_path(os.path.basename(path)))
+        except OSError as e:
+            logging.info("File '{0}' could not be moved to the failure folder: {1}".format(path, e))
+
+    def _unused_failure_path(self, file_name: str) -> str:
+        destination = os.path.join(self._failure_folder, file_name)
+        name, extension = os.path.splitext(file_name)
+        copy_number = 1
+
+        while os.path.exists(destination):
+            destination = os.path.join(self._failure_folder, "{0} ({1}){2}".format(name, copy_number, extension))
+            copy_number += 1
+
+        return destination
@@ -0,0 +1,166 @@
+from typing import Iterable, Iterator, List, Optional
+
+from Specification import (
+    AndSpecification, ColorSpecification, IndexedProducts, OrSpecification, PriceSpecification, Product,
+    SizeSpecification, Specification, XorSpecification
+)
+
+
+class ProductIndex(IndexedProducts):
+
+    _INDEXED_SPECIFICATIONS = {
+        ColorSpecification: "color",
+        SizeSpecification: "size",
+        PriceSpecification: "price",
+    }
+
+    def __init__(self, products: Iterable[Product]=()):
+        self._products = []
+        self._row_keys = []
+        self._rows = {}
+        self._free_rows = []
+        self._bitmaps = {}
+        self.extend(products)
+
+    def insert(self, product: Product) -> int:
+        if id(product) in self._rows:
+            raise ValueError("Product '{0}' is already indexed".format(product.name))
+
+        keys = tuple((attribute, getattr(product, attribute)) for attribute in self._INDEXED_SPECIFICATIONS.values())
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._products[row] = product
+            self._row_keys[row] = keys
+        else:
+            row = len(self._products)
+            self._products.append(product)
+            self._row_keys.append(keys)
+
+        self._rows[id(product)] = row
+        for key in keys:
+            bitmap = self._bitmaps.setdefault(key, bytearray())
+            if len(bitmap) <= row >> 3:
+                bitmap.extend(bytes((row >> 3) + 1 - len(bitmap)))
+            bitmap[row >> 3] |= 1 << (row & 7)
+        return row
+
+    def extend(self, products: Iterable[Product]) -> "ProductIndex":
+        for product in products:
+            self.insert(product)
+        return self
+
+    def delete(self, row: int) -> Product:
+        product = self._products[row] if 0 <= row < len(self._products) else None
+        if product is None:
+            raise KeyError(row)
+
+        for key in self._row_keys[row]:
+            self._bitmaps[key][row >> 3] &= ~(1 << (row & 7)) & 0xFF
+
+        del self._rows[id(product)]
+        self._products[row] = None
+        self._row_keys[row] = None
+        self._free_rows.append(row)
+        return product
+
+    def remove(self, product: Product) -> None:
+        row = self._rows.get(id(product))
+        if row is None:
+            raise ValueError("Product '{0}' is not indexed".format(product.name))
+        self.delete(row)
+
+    def row_of(self, product: Product) -> Optional[int]:
+        return self._rows.get(id(product))
+
+    def bitmap(self, spec: Specification) -> int:
+        attribute = self._INDEXED_SPECIFICATIONS.get(type(spec))
+        if attribute is not None:
+            return int.from_bytes(self._bitmaps.get((attribute, getattr(spec, attribute)), b""), "little")
+        if type(spec) is AndSpecification:
+            return self.bitmap(spec.first) & self.bitmap(spec.second)
+        if type(spec) is OrSpecification:
+            return self.bitmap(spec.first) | self.bitmap(spec.second)
+        if type(spec) is XorSpecification:
+            return self.bitmap(spec.first) ^ self.bitmap(spec.second)
+
+        bitmap = bytearray((len(self._products) + 7) >> 3)
+        for row, product in enumerate(self._products):
+            if product is not None and spec.specification(product):
+                bitmap[row >> 3] |= 1 << (row & 7)
+        return int.from_bytes(bitmap, "little")
+
+    def count(self, spec: Specification) -> int:
+        return bin(self.bitmap(spec)).count("1")
+
+    def filter(self, spec: Specification) -> List[Product]:
+        return [self._products[row] for row in self._rows_in(self.bitmap(spec))]
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, product: Product) -> bool:
+        return id(product) in self._rows
+
+    def __iter__(self) -> Iterator[Product]:
+        return (product for product in self._products if product is not None)
+
+    @staticmethod
+    def _rows_in(bitmap: int) -> Iterator[int]:
+        for byte_index, byte in enumerate(bitmap.to_bytes((bitmap.bit_length() + 7) >> 3, "little")):
+            while byte:
+                low_bit = byte & -byte
+                yield (byte_index << 3) + low_bit.bit_length() - 1
+                byte ^= low_bit
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from Specification import Color, Filter, Price, Size
+
+    rng = random.Random(0)
+    products = [
+        Product("Item", rng.choice(list(Color)), rng.choice(list(Size)), rng.choice(list(Price)))
+        for _ in range(1000000)
+    ]
+    spec = OrSpecification(
+        AndSpecification(
+            AndSpecification(SizeSpecification(Size.LARGE), PriceSpecification(Price.CHEAP)),
+            ColorSpecification(Color.RED)
+        ),
+        XorSpecification(
+            AndSpecification(ColorSpecification(Color.BLUE), SizeSpecification(Size.HUGE)),
+            OrSpecification(PriceSpecification(Price.VERY_EXPENSIVE), ColorSpecification(Color.GREEN))
+        )
+    )
+
+    start = time.perf_counter()
+    index = ProductIndex(products)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scan_count = len(Filter.filter(products, spec))
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index_count = index.count(spec)
+    count_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index_matches = Filter.filter(index, spec)
+    filter_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for product in products[:10000]:
+        index.remove(product)
+    for product in products[:10000]:
+        index.insert(product)
+    update_seconds = time.perf_counter() - start
+
+    assert scan_count == index_count == len(index_matches)
+    print("built index over {0} products in {1:.2f}s".format(len(index), build_seconds))
+    print("scan:         {0} matches in {1:.3f}s".format(scan_count, scan_seconds))
+    print("bitmap count: {0} matches in {1:.4f}s".format(index_count, count_seconds))
+    print("bitmap filter: {0} products in {1:.3f}s".format(len(index_matches), filter_seconds))
+    print("20000 incremental deletes and inserts in {0:.3f}s".format(update_seconds))
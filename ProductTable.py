@@ -0,0 +1,138 @@
+from typing import Iterable, Iterator, List
+
+import numpy as np
+
+from Specification import (
+    AndSpecification, Color, ColorSpecification, OrSpecification, Price, PriceSpecification, Product, Size,
+    SizeSpecification, Specification, XorSpecification
+)
+
+
+class ProductTable:
+
+    _CODE_TYPE = np.uint8
+
+    def __init__(self, products: Iterable[Product]=()):
+        self._names = []
+        self._colors = np.empty(0, dtype=self._CODE_TYPE)
+        self._sizes = np.empty(0, dtype=self._CODE_TYPE)
+        self._prices = np.empty(0, dtype=self._CODE_TYPE)
+        self.extend(products)
+
+    @classmethod
+    def from_columns(cls, names: List[str], colors: np.ndarray, sizes: np.ndarray,
+                     prices: np.ndarray) -> "ProductTable":
+        if not len(names) == len(colors) == len(sizes) == len(prices):
+            raise ValueError("All ProductTable columns must have the same length")
+
+        table = cls()
+        table._names = list(names)
+        table._colors = np.asarray(colors, dtype=cls._CODE_TYPE)
+        table._sizes = np.asarray(sizes, dtype=cls._CODE_TYPE)
+        table._prices = np.asarray(prices, dtype=cls._CODE_TYPE)
+        return table
+
+    def extend(self, products: Iterable[Product]) -> "ProductTable":
+        products = list(products)
+        self._names.extend(product.name for product in products)
+        self._colors = np.concatenate((self._colors, self._codes(product.color for product in products)))
+        self._sizes = np.concatenate((self._sizes, self._codes(product.size for product in products)))
+        self._prices = np.concatenate((self._prices, self._codes(product.price for product in products)))
+        return self
+
+    def append(self, product: Product) -> "ProductTable":
+        return self.extend((product,))
+
+    @property
+    def colors(self) -> np.ndarray:
+        return self._colors
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self._sizes
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices
+
+    def mask(self, spec: Specification) -> np.ndarray:
+        if type(spec) is ColorSpecification:
+            return self._colors == spec.color.value
+        if type(spec) is SizeSpecification:
+            return self._sizes == spec.size.value
+        if type(spec) is PriceSpecification:
+            return self._prices == spec.price.value
+        if type(spec) is AndSpecification:
+            mask = self.mask(spec.first)
+            mask &= self.mask(spec.second)
+            return mask
+        if type(spec) is OrSpecification:
+            mask = self.mask(spec.first)
+            mask |= self.mask(spec.second)
+            return mask
+        if type(spec) is XorSpecification:
+            mask = self.mask(spec.first)
+            mask ^= self.mask(spec.second)
+            return mask
+
+        return np.fromiter((bool(spec.specification(product)) for product in self), dtype=bool, count=len(self))
+
+    def indices(self, spec: Specification) -> np.ndarray:
+        return np.flatnonzero(self.mask(spec))
+
+    def count(self, spec: Specification) -> int:
+        return int(np.count_nonzero(self.mask(spec)))
+
+    def filter(self, spec: Specification) -> List[Product]:
+        return [self[index] for index in self.indices(spec).tolist()]
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, index: int) -> Product:
+        return Product(
+            self._names[index], Color(int(self._colors[index])), Size(int(self._sizes[index])),
+            Price(int(self._prices[index]))
+        )
+
+    def __iter__(self) -> Iterator[Product]:
+        colors, sizes, prices = list(Color), list(Size), list(Price)
+        for name, color, size, price in zip(
+                self._names, self._colors.tolist(), self._sizes.tolist(), self._prices.tolist()):
+            yield Product(name, colors[color - 1], sizes[size - 1], prices[price - 1])
+
+    def _codes(self, members: Iterable) -> np.ndarray:
+        return np.fromiter((member.value for member in members), dtype=self._CODE_TYPE)
+
+
+if __name__ == "__main__":
+    import time
+
+    product_count = 10000000
+    rng = np.random.default_rng(0)
+    table = ProductTable.from_columns(
+        ["Item"] * product_count,
+        rng.integers(1, len(Color) + 1, product_count),
+        rng.integers(1, len(Size) + 1, product_count),
+        rng.integers(1, len(Price) + 1, product_count)
+    )
+    spec = OrSpecification(
+        AndSpecification(
+            AndSpecification(SizeSpecification(Size.LARGE), PriceSpecification(Price.CHEAP)),
+            ColorSpecification(Color.RED)
+        ),
+        XorSpecification(
+            AndSpecification(ColorSpecification(Color.BLUE), SizeSpecification(Size.HUGE)),
+            OrSpecification(PriceSpecification(Price.VERY_EXPENSIVE), ColorSpecification(Color.GREEN))
+        )
+    )
+
+    table.mask(spec)
+    start = time.perf_counter()
+    matches = table.count(spec)
+    elapsed = time.perf_counter() - start
+
+    print("{0} of {1} products match in {2:.1f} ms ({3:.1f} MB of columns)".format(
+        matches, len(table), elapsed * 1000,
+        (table.colors.nbytes + table.sizes.nbytes + table.prices.nbytes) / 1e6
+    ))
@@ -0,0 +1,176 @@
+import multiprocessing
+import multiprocessing.util
+import os
+import sys
+import threading
+import weakref
+from typing import List
+
+from ProgressBar import ProgressBar
+
+
+class ProgressCounter:
+
+    __slots__ = ("_counts", "_slot", "__weakref__")
+
+    def __init__(self, counts, slot: int):
+        self._counts = counts
+        self._slot = slot
+
+    @property
+    def slot(self) -> int:
+        return self._slot
+
+    def increment(self, amount: int=1) -> None:
+        self._counts[self._slot] += amount
+
+
+_PROCESS_COUNTER = None
+
+
+def _claim_slot(counts, next_slot, owners) -> int:
+    pid = os.getpid()
+    with next_slot.get_lock():
+        for slot in range(next_slot.value):
+            owner = owners[slot]
+            if owner == 0 or owner != pid and not _is_process_alive(owner):
+                owners[slot] = pid
+                return slot
+
+        slot = next_slot.value
+        if slot >= len(counts):
+            raise RuntimeError("All {0} progress slots are in use.".format(len(counts)))
+        next_slot.value += 1
+        owners[slot] = pid
+    return slot
+
+
+def _release_slot(next_slot, owners, slot: int) -> None:
+    with next_slot.get_lock():
+        owners[slot] = 0
+
+
+def _is_process_alive(pid: int) -> bool:
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _install_process_counter(counts, next_slot, owners) -> None:
+    global _PROCESS_COUNTER
+    slot = _claim_slot(counts, next_slot, owners)
+    _PROCESS_COUNTER = ProgressCounter(counts, slot)
+    multiprocessing.util.Finalize(None, _release_slot, args=(next_slot, owners, slot), exitpriority=0)
+
+
+def increment_progress(amount: int=1) -> None:
+    _PROCESS_COUNTER.increment(amount)
+
+
+class ProgressAggregator:
+
+    _CURSOR_UP = "\x1b[{0}F"
+    _CLEAR_LINE = "\x1b[2K"
+
+    def __init__(self, total: int, slots: int=64, show_workers: bool=False, interval: float=0.1,
+                 stream=None, decimals: int=1, length: int=50, context=None):
+        context = context or multiprocessing.get_context()
+        self._total = total
+        self._counts = context.RawArray("q", slots)
+        self._next_slot = context.Value("i", 0)
+        self._slot_owners = context.RawArray("q", slots)
+        self._local = threading.local()
+        self._free_slots = []
+
+        self._show_workers = show_workers
+        self._interval = interval
+        self._stream = stream
+        self._bar = ProgressBar(total + 1, decimals=decimals, length=length)
+        self._worker_bars = {}
+        self._decimals = decimals
+        self._length = length
+        self._rendered_lines = 0
+
+        self._stop = threading.Event()
+        self._render_thread = None
+
+    @property
+    def completed(self) -> int:
+        return sum(self._counts)
+
+    def worker_counts(self) -> List[int]:
+        return list(self._counts[:self._next_slot.value])
+
+    def counter(self) -> ProgressCounter:
+        return ProgressCounter(self._counts, _claim_slot(self._counts, self._next_slot, self._slot_owners))
+
+    def increment(self, amount: int=1) -> None:
+        counter = getattr(self._local, "counter", None)
+        if counter is None:
+            counter = self._local.counter = self._thread_counter()
+        counter.increment(amount)
+
+    def _thread_counter(self) -> ProgressCounter:
+        try:
+            counter = ProgressCounter(self._counts, self._free_slots.pop())
+        except IndexError:
+            counter = self.counter()
+        weakref.finalize(counter, self._free_slots.append, counter.slot)
+        return counter
+
+    def process_initializer(self):
+        return _install_process_counter, (self._counts, self._next_slot, self._slot_owners)
+
+    def start(self) -> "ProgressAggregator":
+        if self._render_thread is None:
+            self._stop.clear()
+            self._render_thread = threading.Thread(target=self._render_loop, name="ProgressAggregator", daemon=True)
+            self._render_thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._render_thread is not None:
+            self._stop.set()
+            self._render_thread.join()
+            self._render_thread = None
+        self.render()
+        self._write("\n")
+
+    def __enter__(self) -> "ProgressAggregator":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def render(self) -> None:
+        counts = self.worker_counts()
+        lines = [self._bar.format_line(sum(counts))]
+
+        if self._show_workers:
+            for slot, count in enumerate(counts):
+                worker_bar = self._worker_bars.get(slot)
+                if worker_bar is None:
+                    worker_bar = self._worker_bars[slot] = ProgressBar(
+                        self._total + 1, decimals=self._decimals, length=self._length,
+                        label="Worker {0:>3}".format(slot)
+                    )
+                lines.append(worker_bar.format_line(count))
+
+        cursor = self._CURSOR_UP.format(self._rendered_lines - 1) if self._rendered_lines > 1 else ""
+        self._rendered_lines = len(lines)
+        self._write(cursor + "\n".join(self._CLEAR_LINE + line for line in lines))
+
+    def _render_loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.render()
+
+    def _write(self, text: str) -> None:
+        stream = self._stream or sys.stdout
+        stream.write(text)
+        stream.flush()
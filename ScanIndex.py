@@ -0,0 +1,161 @@
+import logging
+import os
+import sqlite3
+from typing import Dict, List, Tuple
+
+
+class ScanDelta:
+
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.modified = []
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified)
+
+    def __str__(self):
+        return "{0} added, {1} removed, {2} modified".format(len(self.added), len(self.removed), len(self.modified))
+
+
+class ScanIndex:
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS directories ("
+        " path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS directories_parent ON directories (parent)",
+        "CREATE TABLE IF NOT EXISTS files ("
+        " directory TEXT NOT NULL, name TEXT NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL,"
+        " PRIMARY KEY (directory, name))",
+    )
+
+    def __init__(self, index_file: str):
+        self._index_file = index_file
+        self._connection = sqlite3.connect(index_file)
+        for statement in self._SCHEMA:
+            self._connection.execute(statement)
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "ScanIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def scan(self, search_directory: str) -> ScanDelta:
+        logging.info("Updating scan index '{0}' for the '{1}' directory.".format(self._index_file, search_directory))
+
+        delta = ScanDelta()
+        seen_directories = set()
+        pending_directories = [(search_directory, None)]
+
+        with self._connection:
+            while pending_directories:
+                directory, parent = pending_directories.pop()
+                try:
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                except OSError as e:
+                    logging.info("Directory '{0}' could not be indexed: {1}".format(directory, e))
+                    continue
+
+                seen_directories.add(directory)
+                row = self._connection.execute(
+                    "SELECT mtime_ns FROM directories WHERE path = ?", (directory,)
+                ).fetchone()
+
+                if row is not None and row[0] == mtime_ns:
+                    if parent is not None:
+                        self._connection.execute(
+                            "UPDATE directories SET parent = ? WHERE path = ? AND parent IS NOT ?",
+                            (parent, directory, parent)
+                        )
+                    sub_directories = [
+                        path for path, in
+                        self._connection.execute("SELECT path FROM directories WHERE parent = ?", (directory,))
+                    ]
+                else:
+                    sub_directories = self._relist_directory(directory, parent, mtime_ns, delta)
+
+                pending_directories.extend((sub_directory, directory) for sub_directory in sub_directories)
+
+            self._remove_unseen_directories(search_directory, seen_directories, delta)
+
+        return delta
+
+    def files(self, search_directory: str) -> List[str]:
+        return [
+            os.path.join(directory, name)
+            for directory, name in self._connection.execute("SELECT directory, name FROM files ORDER BY directory, name")
+            if self._is_within(directory, search_directory)
+        ]
+
+    def _relist_directory(self, directory: str, parent: str, mtime_ns: int, delta: ScanDelta) -> List[str]:
+        current_files, sub_directories = self._list_directory(directory)
+        indexed_files = {
+            name: (size, file_mtime_ns) for name, size, file_mtime_ns in
+            self._connection.execute("SELECT name, size, mtime_ns FROM files WHERE directory = ?", (directory,))
+        }
+
+        for name, metadata in current_files.items():
+            if name not in indexed_files:
+                delta.added.append(os.path.join(directory, name))
+            elif indexed_files[name] != metadata:
+                delta.modified.append(os.path.join(directory, name))
+
+        for name in indexed_files.keys() - current_files.keys():
+            delta.removed.append(os.path.join(directory, name))
+
+        self._connection.execute("DELETE FROM files WHERE directory = ?", (directory,))
+        self._connection.executemany(
+            "INSERT INTO files (directory, name, size, mtime_ns) VALUES (?, ?, ?, ?)",
+            ((directory, name, size, file_mtime_ns) for name, (size, file_mtime_ns) in current_files.items())
+        )
+        self._connection.execute(
+            "INSERT INTO directories (path, parent, mtime_ns) VALUES (?, ?, ?) ON CONFLICT (path) DO UPDATE SET"
+            " parent = COALESCE(excluded.parent, directories.parent), mtime_ns = excluded.mtime_ns",
+            (directory, parent, mtime_ns)
+        )
+
+        return sub_directories
+
+    def _remove_unseen_directories(self, search_directory: str, seen_directories: set, delta: ScanDelta) -> None:
+        unseen_directories = [
+            path for path, in self._connection.execute("SELECT path FROM directories")
+            if path not in seen_directories and self._is_within(path, search_directory)
+        ]
+
+        for directory in unseen_directories:
+            delta.removed.extend(
+                os.path.join(directory, name) for name, in
+                self._connection.execute("SELECT name FROM files WHERE directory = ?", (directory,))
+            )
+            self._connection.execute("DELETE FROM files WHERE directory = ?", (directory,))
+            self._connection.execute("DELETE FROM directories WHERE path = ?", (directory,))
+
+    @staticmethod
+    def _list_directory(directory: str) -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+        files, sub_directories = {}, []
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                sub_directories.append(entry.path)
+                        else:
+                            stat = entry.stat()
+                            files[entry.name] = (stat.st_size, stat.st_mtime_ns)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logging.info("Directory '{0}' could not be indexed: {1}".format(directory, e))
+
+        return files, sub_directories
+
+    @staticmethod
+    def _is_within(path: str, directory: str) -> bool:
+        return path == directory or path.startswith(os.path.join(directory, ""))
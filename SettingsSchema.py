@@ -0,0 +1,97 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class SettingsValidationError(ValueError):
+
+    def __init__(self, errors: List[str]):
+        super().__init__("Invalid settings:\n  " + "\n  ".join(errors))
+        self.errors = errors
+
+
+class Field:
+
+    def __init__(self, key: str, name: str, kind: type, default: Any, minimum: Any=None, maximum: Any=None,
+                 choices: Optional[Sequence[Any]]=None, item_kind: Optional[type]=None,
+                 convert: Optional[Callable[[Any], Any]]=None):
+        self.key = key
+        self.name = name
+        self.kind = kind
+        self.default = default
+        self.minimum = minimum
+        self.maximum = maximum
+        self.choices = frozenset(choices) if choices is not None else None
+        self.item_kind = item_kind
+        self.convert = convert
+
+
+class SettingsSchema:
+
+    def __init__(self, fields: Iterable[Field]):
+        self._fields = list(fields)
+        self._validators = [self._compile_field(field) for field in self._fields]
+
+    @property
+    def fields(self) -> List[Field]:
+        return list(self._fields)
+
+    def validate(self, config: Dict[str, Any], strict: bool=False) -> Tuple[Dict[str, Any], List[str]]:
+        values, errors = {}, []
+        for validator in self._validators:
+            validator(config, values, errors)
+
+        if strict and errors:
+            raise SettingsValidationError(errors)
+
+        return values, errors
+
+    def validate_many(self, configs: Iterable[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], List[str]]]:
+        validators = self._validators
+        results = []
+
+        for config in configs:
+            values, errors = {}, []
+            for validator in validators:
+                validator(config, values, errors)
+            results.append((values, errors))
+
+        return results
+
+    @staticmethod
+    def _compile_field(field: Field) -> Callable[[Dict[str, Any], Dict[str, Any], List[str]], None]:
+        key, name, kind, item_kind = field.key, field.name, field.kind, field.item_kind
+        minimum, maximum, choices = field.minimum, field.maximum, field.choices
+        convert = field.convert or (lambda value: value)
+        default = convert(field.default)
+        expected = "{0} of {1}".format(kind.__name__, item_kind.__name__) if item_kind else kind.__name__
+
+        def validate(config, values, errors):
+            value = config.get(key)
+            if value is None:
+                values[name] = default
+                return
+
+            if type(value) is not kind or (item_kind is not None and
+                                           not all(isinstance(item, item_kind) for item in value)):
+                errors.append("{0}: expected {1}, got {2!r}; using default {3!r}".format(
+                    key, expected, value, field.default
+                ))
+                values[name] = default
+                return
+
+            if minimum is not None and value < minimum:
+                errors.append("{0}: {1!r} is below the minimum {2!r}; using {2!r}".format(key, value, minimum))
+                value = minimum
+            elif maximum is not None and value > maximum:
+                errors.append("{0}: {1!r} is above the maximum {2!r}; using {2!r}".format(key, value, maximum))
+                value = maximum
+
+            if choices is not None and value not in choices:
+                errors.append("{0}: {1!r} is not one of {2}; using default {3!r}".format(
+                    key, value, sorted(choices), field.default
+                ))
+                values[name] = default
+                return
+
+            values[name] = convert(value)
+
+        return validate
@@ -98,9 +98,18 @@ class XorSpecification(Specification):
         return self.first.specification(product) ^ self.second.specification(product)
 
 
+class IndexedProducts(ABC):
+
+    @abstractmethod
+    def filter(self, spec: Specification) -> list:
+        pass
+
+
 class Filter:
     @staticmethod
     def filter(products, spec):
+        if isinstance(products, IndexedProducts):
+            return products.filter(spec)
         return list(filter(lambda product: spec.specification(product), products))
 
 
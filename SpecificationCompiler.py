@@ -0,0 +1,127 @@
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from Specification import (
+    AndSpecification, ColorSpecification, OrSpecification, PriceSpecification, Product, SizeSpecification,
+    Specification, XorSpecification
+)
+
+
+class CompiledSpecification(Specification):
+
+    def __init__(self, predicate: Callable[[Product], bool], source: str):
+        self._predicate = predicate
+        self.source = source
+
+    def specification(self, product: Product) -> bool:
+        return self._predicate(product)
+
+    def filter(self, products: Iterable[Product]) -> List[Product]:
+        return list(filter(self._predicate, products))
+
+
+class SpecificationCompiler:
+
+    _ATTRIBUTE_SPECIFICATIONS = (
+        (ColorSpecification, "color"),
+        (SizeSpecification, "size"),
+        (PriceSpecification, "price"),
+    )
+
+    def __init__(self, sample: Optional[Sequence[Product]]=None):
+        self._sample = list(sample) if sample is not None else []
+
+    def compile(self, spec: Specification) -> CompiledSpecification:
+        constants = {}
+        expression = self._expression(spec, constants)
+        source = "def predicate(product):\n    return {0}\n".format(expression)
+
+        namespace = dict(constants)
+        exec(compile(source, "<compiled specification>", "exec"), namespace)
+        return CompiledSpecification(namespace["predicate"], source)
+
+    def _expression(self, spec: Specification, constants: dict) -> str:
+        for specification_type, attribute in self._ATTRIBUTE_SPECIFICATIONS:
+            if type(spec) is specification_type:
+                return "product.{0} == {1}".format(attribute, self._constant(getattr(spec, attribute), constants))
+
+        if type(spec) in (AndSpecification, OrSpecification):
+            operands = self._ordered_operands(spec)
+            joiner = " and " if type(spec) is AndSpecification else " or "
+            return "({0})".format(joiner.join(self._expression(operand, constants) for operand in operands))
+
+        if type(spec) is XorSpecification:
+            return "(bool({0}) ^ bool({1}))".format(
+                self._expression(spec.first, constants), self._expression(spec.second, constants)
+            )
+
+        return "{0}(product)".format(self._constant(spec.specification, constants))
+
+    def _ordered_operands(self, spec: Specification) -> List[Specification]:
+        operands = self._flatten(spec, type(spec))
+        if not self._sample:
+            return operands
+
+        selectivities = [self._pass_rate(operand) for operand in operands]
+        ordered = sorted(zip(selectivities, range(len(operands)), operands), key=lambda item: item[:2])
+        if type(spec) is OrSpecification:
+            ordered = sorted(ordered, key=lambda item: (-item[0], item[1]))
+        return [operand for _, _, operand in ordered]
+
+    def _flatten(self, spec: Specification, operator: type) -> List[Specification]:
+        if type(spec) is not operator:
+            return [spec]
+        return self._flatten(spec.first, operator) + self._flatten(spec.second, operator)
+
+    def _pass_rate(self, spec: Specification) -> float:
+        return sum(1 for product in self._sample if spec.specification(product)) / len(self._sample)
+
+    @staticmethod
+    def _constant(value, constants: dict) -> str:
+        name = "constant_{0}".format(len(constants))
+        constants[name] = value
+        return name
+
+
+def compile_specification(spec: Specification, sample: Optional[Iterable[Product]]=None) -> CompiledSpecification:
+    return SpecificationCompiler(list(sample) if sample is not None else None).compile(spec)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from Specification import Color, Filter, Price, Size
+
+    rng = random.Random(0)
+    products = [
+        Product("Item", rng.choice(list(Color)), rng.choice(list(Size)), rng.choice(list(Price)))
+        for _ in range(1000000)
+    ]
+    spec = OrSpecification(
+        AndSpecification(
+            AndSpecification(SizeSpecification(Size.LARGE), PriceSpecification(Price.CHEAP)),
+            ColorSpecification(Color.RED)
+        ),
+        XorSpecification(
+            AndSpecification(ColorSpecification(Color.BLUE), SizeSpecification(Size.HUGE)),
+            OrSpecification(PriceSpecification(Price.VERY_EXPENSIVE), ColorSpecification(Color.GREEN))
+        )
+    )
+
+    start = time.perf_counter()
+    tree_result = Filter.filter(products, spec)
+    tree_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = compile_specification(spec, rng.sample(products, 1000))
+    compile_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    compiled_result = compiled.filter(products)
+    compiled_seconds = time.perf_counter() - start
+
+    assert compiled_result == tree_result
+    print(compiled.source)
+    print("tree-walking: {0} matches in {1:.3f}s".format(len(tree_result), tree_seconds))
+    print("compiled:     {0} matches in {1:.3f}s (+{2:.4f}s to compile, {3:.1f}x faster)".format(
+        len(compiled_result), compiled_seconds, compile_seconds, tree_seconds / compiled_seconds
+    ))
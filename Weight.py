@@ -1,4 +1,7 @@
+from decimal import Decimal
 from enum import Enum
+from fractions import Fraction
+from functools import total_ordering
 from typing import Union
 
 import datetime
@@ -10,56 +13,126 @@ class WeightUnit(Enum):
     LB = 453.592
 
 
+def _exact_number(value: Union[int, float, Fraction, Decimal]) -> Fraction:
+    return Fraction(str(value)) if type(value) is float else Fraction(value)
+
+
+_MICROGRAMS_PER_UNIT = {
+    unit: int(_exact_number(unit.value) * 1000000) for unit in WeightUnit
+}
+
+
+@total_ordering
 class Weight:
 
-    def __init__(self, weight: Union[int, float], weight_unit: WeightUnit):
-        self._weight = weight
+    __slots__ = ("_micrograms", "_weight_unit")
+
+    _NUMBER_TYPES = (int, float, Fraction, Decimal)
+
+    def __init__(self, weight: Union[int, float, Fraction, Decimal], weight_unit: WeightUnit):
+        self._micrograms = self._to_micrograms(weight, _MICROGRAMS_PER_UNIT[weight_unit])
         self._weight_unit = weight_unit
 
+    @classmethod
+    def _from_micrograms(cls, micrograms: Union[int, Fraction], weight_unit: WeightUnit) -> "Weight":
+        weight = cls.__new__(cls)
+        weight._micrograms = micrograms
+        weight._weight_unit = weight_unit
+        return weight
+
+    @staticmethod
+    def _to_micrograms(value, micrograms_per_unit: int) -> Union[int, Fraction]:
+        if type(value) is int:
+            return value * micrograms_per_unit
+        if not isinstance(value, (Fraction, Decimal)):
+            return round(value * micrograms_per_unit)
+        micrograms = Fraction(value) * micrograms_per_unit
+        return micrograms.numerator if micrograms.denominator == 1 else micrograms
+
+    @staticmethod
+    def to_micrograms(weight: Union[int, float, Fraction, Decimal], weight_unit: WeightUnit) -> Union[int, Fraction]:
+        return Weight._to_micrograms(weight, _MICROGRAMS_PER_UNIT[weight_unit])
+
+    @classmethod
+    def from_micrograms(cls, micrograms: Union[int, float, Fraction], weight_unit: WeightUnit) -> "Weight":
+        return cls._from_micrograms(cls._to_micrograms(micrograms, 1), weight_unit)
+
+    @staticmethod
+    def _from_canonical(micrograms: Union[int, Fraction], weight_unit: WeightUnit):
+        return micrograms / _MICROGRAMS_PER_UNIT[weight_unit]
+
     @property
     def weight(self):
-        return self._weight
+        return self._from_canonical(self._micrograms, self._weight_unit)
 
     @property
     def weight_unit(self):
         return self._weight_unit
 
+    @property
+    def micrograms(self) -> Union[int, Fraction]:
+        return self._micrograms
+
+    @property
+    def milligrams(self) -> Union[int, Fraction]:
+        milligrams = Fraction(self._micrograms, 1000)
+        return milligrams.numerator if milligrams.denominator == 1 else milligrams
+
+    def convert(self, weight_unit: WeightUnit) -> "Weight":
+        return self._from_micrograms(self._micrograms, weight_unit)
+
     def _common_weight_convert(self):
-        return self._weight * self._weight_unit.value
+        return self._from_canonical(self._micrograms, WeightUnit.G)
 
-    def __add__(self, other):
-        if type(other) in (int, float):
-            return (self._common_weight_convert() + other) / self.weight_unit.value
+    def _other_micrograms(self, other, action: str):
+        if type(other) in self._NUMBER_TYPES:
+            return self._to_micrograms(other, _MICROGRAMS_PER_UNIT[WeightUnit.G])
 
         elif type(other) is Weight:
-            return (self._common_weight_convert() + other._common_weight_convert()) / self._weight_unit.value
+            return other._micrograms
 
         else:
-            raise ArithmeticError("Can't implicitly add {0} to weight".format(type(other)))
+            raise ArithmeticError("Can't implicitly {0} weight".format(action.format(type(other))))
+
+    def __add__(self, other):
+        return self._from_canonical(
+            self._micrograms + self._other_micrograms(other, "add {0} to"), self._weight_unit
+        )
 
     def __radd__(self, other):
         return self.__add__(other)
 
     def __iadd__(self, other):
-        self._weight = self.__add__(other)
-        return self
+        return self._from_micrograms(self._micrograms + self._other_micrograms(other, "add {0} to"), self._weight_unit)
 
     def __sub__(self, other):
-        if type(other) in (int, float):
-            return (self._common_weight_convert() - other) / self.weight_unit.value
-
-        elif type(other) is Weight:
-            return (self._common_weight_convert() - other._common_weight_convert()) / self._weight_unit.value
-
-        else:
-            raise ArithmeticError("Can't implicitly subtract {0} from weight".format(type(other)))
+        return self._from_canonical(
+            self._micrograms - self._other_micrograms(other, "subtract {0} from"), self._weight_unit
+        )
 
     def __rsub__(self, other):
         return self.__sub__(other)
 
     def __isub__(self, other):
-        self._weight = self.__sub__(other)
-        return self
+        return self._from_micrograms(
+            self._micrograms - self._other_micrograms(other, "subtract {0} from"), self._weight_unit
+        )
+
+    def __eq__(self, other):
+        if type(other) is not Weight:
+            return NotImplemented
+        return self._micrograms == other._micrograms
+
+    def __lt__(self, other):
+        if type(other) is not Weight:
+            return NotImplemented
+        return self._micrograms < other._micrograms
+
+    def __hash__(self):
+        return hash(self._micrograms)
+
+    def __repr__(self):
+        return "Weight({0!r}, WeightUnit.{1})".format(self.weight, self._weight_unit.name)
 
     def __str__(self):
-        return "{0:0.2f} {1}".format(self._weight, self._weight_unit.name)
+        return "{0:0.2f} {1}".format(float(self.weight), self._weight_unit.name)
@@ -0,0 +1,214 @@
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from typing import Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from Weight import Weight, WeightUnit
+
+
+class QuantileSketch:
+
+    __slots__ = ("_gamma", "_log_gamma", "_positive", "_negative", "_zero_count", "_count")
+
+    def __init__(self, relative_accuracy: float=0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = {}
+        self._negative = {}
+        self._zero_count = 0
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._positive) + len(self._negative) + (1 if self._zero_count else 0)
+
+    def add(self, value: float) -> None:
+        self._count += 1
+        if value > 0:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._positive[index] = self._positive.get(index, 0) + 1
+        elif value < 0:
+            index = math.ceil(math.log(-value) / self._log_gamma)
+            self._negative[index] = self._negative.get(index, 0) + 1
+        else:
+            self._zero_count += 1
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if other._gamma != self._gamma:
+            raise ValueError("Can't merge quantile sketches with different accuracies")
+
+        for buckets, other_buckets in ((self._positive, other._positive), (self._negative, other._negative)):
+            for index, count in other_buckets.items():
+                buckets[index] = buckets.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self._count += other._count
+        return self
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        if not 0 <= quantile <= 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if not self._count:
+            return None
+
+        rank = quantile * (self._count - 1)
+        seen = 0
+        for value, count in self._ordered_buckets():
+            seen += count
+            if seen > rank:
+                return value
+
+    def _ordered_buckets(self) -> Iterator[Tuple[float, int]]:
+        for index in sorted(self._negative, reverse=True):
+            yield -self._bucket_value(index), self._negative[index]
+        if self._zero_count:
+            yield 0.0, self._zero_count
+        for index in sorted(self._positive):
+            yield self._bucket_value(index), self._positive[index]
+
+    def _bucket_value(self, index: int) -> float:
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+
+class WeightStatistics:
+
+    __slots__ = ("count", "total_micrograms", "min_micrograms", "max_micrograms", "sketch", "_weight_unit")
+
+    def __init__(self, weight_unit: WeightUnit, relative_accuracy: float):
+        self.count = 0
+        self.total_micrograms = 0
+        self.min_micrograms = None
+        self.max_micrograms = None
+        self.sketch = QuantileSketch(relative_accuracy)
+        self._weight_unit = weight_unit
+
+    @property
+    def sum(self) -> Weight:
+        return self._weight(self.total_micrograms)
+
+    @property
+    def mean(self) -> Optional[Weight]:
+        return self._weight(Fraction(self.total_micrograms, self.count)) if self.count else None
+
+    @property
+    def min(self) -> Optional[Weight]:
+        return self._weight(self.min_micrograms) if self.count else None
+
+    @property
+    def max(self) -> Optional[Weight]:
+        return self._weight(self.max_micrograms) if self.count else None
+
+    def quantile(self, quantile: float) -> Optional[Weight]:
+        micrograms = self.sketch.quantile(quantile)
+        if micrograms is None:
+            return None
+        return self._weight(min(max(micrograms, self.min_micrograms), self.max_micrograms))
+
+    def merge(self, other: "WeightStatistics") -> "WeightStatistics":
+        if other.count:
+            self.min_micrograms = other.min_micrograms if self.min_micrograms is None else min(
+                self.min_micrograms, other.min_micrograms
+            )
+            self.max_micrograms = other.max_micrograms if self.max_micrograms is None else max(
+                self.max_micrograms, other.max_micrograms
+            )
+        self.count += other.count
+        self.total_micrograms += other.total_micrograms
+        self.sketch.merge(other.sketch)
+        return self
+
+    def _weight(self, micrograms) -> Weight:
+        return Weight.from_micrograms(micrograms, self._weight_unit)
+
+    def __str__(self):
+        return "count={0} sum={1} min={2} max={3}".format(self.count, self.sum, self.min, self.max)
+
+
+class WeightAggregator:
+
+    def __init__(self, weight_unit: WeightUnit=WeightUnit.KG, relative_accuracy: float=0.01):
+        self._weight_unit = weight_unit
+        self._relative_accuracy = relative_accuracy
+        self._statistics = {}
+
+    @property
+    def weight_unit(self) -> WeightUnit:
+        return self._weight_unit
+
+    def add(self, key: Hashable, weight: Union[int, float], weight_unit: WeightUnit) -> None:
+        self.consume(((key, weight, weight_unit),))
+
+    def consume(self, records: Iterable[Tuple[Hashable, Union[int, float], WeightUnit]]) -> "WeightAggregator":
+        statistics = self._statistics
+        to_micrograms = Weight.to_micrograms
+        weight_unit, relative_accuracy = self._weight_unit, self._relative_accuracy
+
+        for key, weight, unit in records:
+            micrograms = to_micrograms(weight, unit)
+
+            key_statistics = statistics.get(key)
+            if key_statistics is None:
+                key_statistics = statistics[key] = WeightStatistics(weight_unit, relative_accuracy)
+                key_statistics.min_micrograms = key_statistics.max_micrograms = micrograms
+            elif micrograms < key_statistics.min_micrograms:
+                key_statistics.min_micrograms = micrograms
+            elif micrograms > key_statistics.max_micrograms:
+                key_statistics.max_micrograms = micrograms
+
+            key_statistics.count += 1
+            key_statistics.total_micrograms += micrograms
+            key_statistics.sketch.add(micrograms)
+
+        return self
+
+    def merge(self, other: "WeightAggregator") -> "WeightAggregator":
+        for key, other_statistics in other._statistics.items():
+            key_statistics = self._statistics.get(key)
+            if key_statistics is None:
+                key_statistics = self._statistics[key] = WeightStatistics(self._weight_unit, self._relative_accuracy)
+            key_statistics.merge(other_statistics)
+        return self
+
+    @classmethod
+    def aggregate_in_parallel(cls, record_chunks: Iterable[List[Tuple[Hashable, Union[int, float], WeightUnit]]],
+                              weight_unit: WeightUnit=WeightUnit.KG, relative_accuracy: float=0.01,
+                              workers: Optional[int]=None) -> "WeightAggregator":
+        aggregator = cls(weight_unit, relative_accuracy)
+        window = 2 * (workers or os.cpu_count() or 1)
+        pending = deque()
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in record_chunks:
+                pending.append(executor.submit(_aggregate_chunk, chunk, weight_unit, relative_accuracy))
+                if len(pending) >= window:
+                    aggregator.merge(pending.popleft().result())
+            while pending:
+                aggregator.merge(pending.popleft().result())
+        return aggregator
+
+    def keys(self) -> List[Hashable]:
+        return list(self._statistics)
+
+    def items(self) -> List[Tuple[Hashable, WeightStatistics]]:
+        return list(self._statistics.items())
+
+    def __getitem__(self, key: Hashable) -> WeightStatistics:
+        return self._statistics[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._statistics
+
+    def __len__(self) -> int:
+        return len(self._statistics)
+
+
+def _aggregate_chunk(records: List[Tuple[Hashable, Union[int, float], WeightUnit]], weight_unit: WeightUnit,
+                     relative_accuracy: float) -> WeightAggregator:
+    return WeightAggregator(weight_unit, relative_accuracy).consume(records)
@@ -0,0 +1,139 @@
+from decimal import Decimal
+from numbers import Real
+from typing import Iterable, Union
+
+import numpy as np
+
+from Weight import Weight, WeightUnit
+
+
+class WeightArray:
+
+    __array_ufunc__ = None
+
+    def __init__(self, weights: Iterable[Union[int, float]], weight_unit: WeightUnit=WeightUnit.G):
+        self._grams = np.asarray(weights, dtype=np.float64) * weight_unit.value
+        self._weight_unit = weight_unit
+
+    @classmethod
+    def from_weights(cls, weights: Iterable[Weight], weight_unit: WeightUnit=WeightUnit.G) -> "WeightArray":
+        grams = np.fromiter((float(weight._common_weight_convert()) for weight in weights), dtype=np.float64)
+        return cls._from_grams(grams, weight_unit)
+
+    @classmethod
+    def _from_grams(cls, grams: np.ndarray, weight_unit: WeightUnit) -> "WeightArray":
+        weight_array = cls.__new__(cls)
+        weight_array._grams = grams
+        weight_array._weight_unit = weight_unit
+        return weight_array
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._grams / self._weight_unit.value
+
+    @property
+    def grams(self) -> np.ndarray:
+        return self._grams
+
+    @property
+    def weight_unit(self) -> WeightUnit:
+        return self._weight_unit
+
+    def convert(self, weight_unit: WeightUnit) -> "WeightArray":
+        return self._from_grams(self._grams, weight_unit)
+
+    def sum(self) -> Weight:
+        return Weight(float(self._grams.sum()) / self._weight_unit.value, self._weight_unit)
+
+    def mean(self) -> Weight:
+        if not len(self):
+            raise ArithmeticError("Can't take the mean of an empty WeightArray")
+        return Weight(float(self._grams.mean()) / self._weight_unit.value, self._weight_unit)
+
+    def _other_grams(self, other, action: str):
+        if type(other) is WeightArray:
+            return other._grams
+        elif type(other) is Weight:
+            return float(other._common_weight_convert())
+        elif isinstance(other, (Real, Decimal)):
+            return float(other)
+        else:
+            raise ArithmeticError("Can't implicitly {0} {1} and a weight array".format(action, type(other)))
+
+    def __add__(self, other):
+        return self._from_grams(self._grams + self._other_grams(other, "add"), self._weight_unit)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        return self._from_grams(self._grams - self._other_grams(other, "subtract"), self._weight_unit)
+
+    def __rsub__(self, other):
+        return self._from_grams(self._other_grams(other, "subtract") - self._grams, self._weight_unit)
+
+    def __eq__(self, other):
+        return self._grams == self._other_grams(other, "compare")
+
+    def __ne__(self, other):
+        return self._grams != self._other_grams(other, "compare")
+
+    def __lt__(self, other):
+        return self._grams < self._other_grams(other, "compare")
+
+    def __le__(self, other):
+        return self._grams <= self._other_grams(other, "compare")
+
+    def __gt__(self, other):
+        return self._grams > self._other_grams(other, "compare")
+
+    def __ge__(self, other):
+        return self._grams >= self._other_grams(other, "compare")
+
+    __hash__ = None
+
+    def __len__(self):
+        return len(self._grams)
+
+    def __getitem__(self, index):
+        grams = self._grams[index]
+        if np.ndim(grams) == 0:
+            return Weight(float(grams) / self._weight_unit.value, self._weight_unit)
+        return self._from_grams(grams, self._weight_unit)
+
+    def __iter__(self):
+        for weight in self.weights:
+            yield Weight(float(weight), self._weight_unit)
+
+    def __str__(self):
+        return "[{0}] {1}".format(" ".join("{0:0.2f}".format(weight) for weight in self.weights),
+                                  self._weight_unit.name)
+
+
+if __name__ == "__main__":
+    import time
+
+    shipment_count = 1000000
+    rng = np.random.default_rng(0)
+    kilograms = rng.uniform(0.1, 30, shipment_count)
+    pounds = rng.uniform(0.1, 60, shipment_count)
+    shipments = [Weight(float(weight), WeightUnit.KG) for weight in kilograms]
+    returns = [Weight(float(weight), WeightUnit.LB) for weight in pounds]
+
+    start = time.perf_counter()
+    total = Weight(0, WeightUnit.KG)
+    for shipment, returned in zip(shipments, returns):
+        total += shipment
+        total -= returned
+    loop_seconds = time.perf_counter() - start
+
+    shipment_array = WeightArray(kilograms, WeightUnit.KG)
+    return_array = WeightArray(pounds, WeightUnit.LB)
+    start = time.perf_counter()
+    array_total = (shipment_array - return_array).sum()
+    array_seconds = time.perf_counter() - start
+
+    print("Python loop over Weight: {0} in {1:.3f}s".format(total, loop_seconds))
+    print("WeightArray:             {0} in {1:.4f}s ({2:.0f}x faster)".format(
+        array_total, array_seconds, loop_seconds / array_seconds
+    ))
@@ -0,0 +1,97 @@
+import heapq
+import itertools
+import os
+from enum import Enum, unique
+from typing import Iterable, Iterator
+
+from FileRecord import FileRecord
+
+
+@unique
+class SchedulingPolicy(Enum):
+    SHORTEST_JOB_FIRST = 1
+    OLDEST_FIRST = 2
+    FAIR_SHARE = 3
+
+
+class WorkQueue:
+
+    _PRUNE_TURNS_MINIMUM = 64
+
+    def __init__(self, policy: SchedulingPolicy=SchedulingPolicy.SHORTEST_JOB_FIRST, records: Iterable[FileRecord]=()):
+        self._policy = policy
+        self._sequence = itertools.count()
+        self._heap = []
+        self._length = 0
+
+        self._directory_heaps = {}
+        self._directory_turns = {}
+        self._current_turn = 0
+        self._prune_turns_at = self._PRUNE_TURNS_MINIMUM
+
+        self.extend(records)
+
+    @property
+    def policy(self) -> SchedulingPolicy:
+        return self._policy
+
+    def push(self, record: FileRecord) -> None:
+        self._length += 1
+
+        if self._policy is SchedulingPolicy.SHORTEST_JOB_FIRST:
+            heapq.heappush(self._heap, (record.size, next(self._sequence), record))
+
+        elif self._policy is SchedulingPolicy.OLDEST_FIRST:
+            heapq.heappush(self._heap, (record.mtime, next(self._sequence), record))
+
+        else:
+            directory = os.path.dirname(record.path)
+            directory_heap = self._directory_heaps.setdefault(directory, [])
+            if not directory_heap:
+                turn = max(self._directory_turns.get(directory, 0), self._current_turn)
+                heapq.heappush(self._heap, (turn, next(self._sequence), directory))
+            heapq.heappush(directory_heap, (record.size, next(self._sequence), record))
+
+    def extend(self, records: Iterable[FileRecord]) -> None:
+        for record in records:
+            self.push(record)
+
+    def pop(self) -> FileRecord:
+        if not self._length:
+            raise IndexError("pop from an empty WorkQueue")
+        self._length -= 1
+
+        if self._policy is not SchedulingPolicy.FAIR_SHARE:
+            return heapq.heappop(self._heap)[2]
+
+        turn, _, directory = heapq.heappop(self._heap)
+        directory_heap = self._directory_heaps[directory]
+        record = heapq.heappop(directory_heap)[2]
+
+        self._current_turn = turn
+        self._directory_turns[directory] = turn + 1
+        if directory_heap:
+            heapq.heappush(self._heap, (turn + 1, next(self._sequence), directory))
+        else:
+            del self._directory_heaps[directory]
+            if len(self._directory_turns) > self._prune_turns_at:
+                self._prune_directory_turns()
+
+        return record
+
+    def _prune_directory_turns(self) -> None:
+        self._directory_turns = {
+            directory: turn for directory, turn in self._directory_turns.items() if turn > self._current_turn
+        }
+        self._prune_turns_at = max(2 * len(self._directory_turns), self._PRUNE_TURNS_MINIMUM)
+
+    def paths(self) -> Iterator[str]:
+        for record in self:
+            yield record.path
+
+    def __iter__(self) -> Iterator[FileRecord]:
+        while self._length:
+            yield self.pop()
+
+    def __len__(self) -> int:
+        return self._length
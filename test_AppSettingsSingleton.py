@@ -1,6 +1,9 @@
 import json
 import logging
 import os
+import pickle
+import threading
+import time
 from os.path import join, normpath
 import pytest
 
@@ -18,6 +21,15 @@ def setup(request):
     request.addfinalizer(finalize)
 
 
+class _CreateFileOnUnpickle(object):
+
+    def __init__(self, path):
+        self.path = path
+
+    def __reduce__(self):
+        return open, (self.path, "w")
+
+
 class TestAppSettings(object):
 
     source_directory = "SourceDirectory"
@@ -195,6 +207,178 @@ class TestAppSettings(object):
 
         assert app2 is app1
 
+    def test_reload_swaps_in_new_values(self, tmp_path):
+        config = tmp_path / "appsettings.json"
+        config.write_text(json.dumps(self.correct_config))
+        app = AppSettingsSingleton(str(config))
+
+        config.write_text(json.dumps(dict(self.correct_config, RetryLimit=42, LogLevel="ERROR")))
+        assert app.reload()
+
+        assert app.retry_limit == 42
+        assert app.log_level == "ERROR"
+
+    def test_reload_keeps_values_when_config_is_invalid(self, tmp_path):
+        config = tmp_path / "appsettings.json"
+        config.write_text(json.dumps(self.correct_config))
+        app = AppSettingsSingleton(str(config))
+
+        config.write_text("{not json")
+        assert not app.reload()
+        config.unlink()
+        assert not app.reload()
+
+        assert app.retry_limit == self.correct_config[self.retry_limit]
+
+    def test_non_object_config_is_rejected_and_hot_reload_survives(self, tmp_path):
+        config = tmp_path / "appsettings.json"
+        config.write_text(json.dumps(self.correct_config))
+        app = AppSettingsSingleton(str(config))
+
+        config.write_text("[]")
+        assert not app.reload()
+
+        app.start_hot_reload(interval_seconds=0.01)
+        time.sleep(0.05)
+        config.write_text(json.dumps(dict(self.correct_config, RetryWaitMs=4321)))
+        deadline = time.monotonic() + 5
+        while app.retry_wait_ms != 4321 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert app.retry_wait_ms == 4321
+
+    def test_snapshot_is_immutable(self, tmp_path):
+        config = tmp_path / "appsettings.json"
+        config.write_text(json.dumps(self.correct_config))
+        app = AppSettingsSingleton(str(config))
+
+        with pytest.raises(AttributeError):
+            app.snapshot.retry_limit = 3
+        app.video_extension.append("mov")
+        assert app.video_extension == self.correct_config[self.video_extensions]
+
+    def test_hot_reload_picks_up_changes(self, tmp_path):
+        config = tmp_path / "appsettings.json"
+        config.write_text(json.dumps(self.correct_config))
+        app = AppSettingsSingleton(str(config)).start_hot_reload(interval_seconds=0.01)
+
+        config.write_text(json.dumps(dict(self.correct_config, RetryWaitMs=1234)))
+        deadline = time.monotonic() + 5
+        while app.retry_wait_ms != 1234 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert app.retry_wait_ms == 1234
+
+    def test_readers_see_consistent_snapshots_during_reloads(self, tmp_path):
+        config = tmp_path / "appsettings.json"
+        first = dict(self.correct_config, RetryLimit=1, RetryWaitMs=1)
+        second = dict(self.correct_config, RetryLimit=2, RetryWaitMs=2)
+        config.write_text(json.dumps(first))
+        app = AppSettingsSingleton(str(config))
+
+        stop = threading.Event()
+        inconsistent = []
+
+        def read():
+            while not stop.is_set():
+                snapshot = app.snapshot
+                if snapshot.retry_limit != snapshot.retry_wait_ms:
+                    inconsistent.append(snapshot)
+                time.sleep(0)
+
+        readers = [threading.Thread(target=read) for _ in range(8)]
+        for reader in readers:
+            reader.start()
+
+        for reload_number in range(50):
+            config.write_text(json.dumps(second if reload_number % 2 else first))
+            assert app.reload()
+
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+        assert inconsistent == []
+        assert app.retry_limit == app.retry_wait_ms == 2
+
+    def test_snapshot_cache_skips_parsing_when_config_unchanged(self, tmp_path, monkeypatch):
+        config = tmp_path / "appsettings.json"
+        cache = tmp_path / "appsettings.snapshot"
+        config.write_text(json.dumps(self.correct_config))
+
+        AppSettingsSingleton(str(config), str(cache))
+        AppSettingsSingleton.delete_instance_for_tests()
+        assert cache.exists()
+
+        monkeypatch.setattr(LoadFileContent, "load_json", lambda x: exec('raise(AssertionError(x))'))
+        app = AppSettingsSingleton(str(config), str(cache))
+
+        assert app.retry_limit == self.correct_config[self.retry_limit]
+        assert app.video_extension == self.correct_config[self.video_extensions]
+
+    def test_snapshot_cache_invalidated_when_config_changes(self, tmp_path):
+        config = tmp_path / "appsettings.json"
+        cache = tmp_path / "appsettings.snapshot"
+        config.write_text(json.dumps(self.correct_config))
+        AppSettingsSingleton(str(config), str(cache))
+        AppSettingsSingleton.delete_instance_for_tests()
+
+        config.write_text(json.dumps(dict(self.correct_config, RetryLimit=7)))
+        app = AppSettingsSingleton(str(config), str(cache))
+
+        assert app.retry_limit == 7
+
+    def test_corrupt_snapshot_cache_is_ignored(self, tmp_path):
+        config = tmp_path / "appsettings.json"
+        cache = tmp_path / "appsettings.snapshot"
+        config.write_text(json.dumps(self.correct_config))
+        cache.write_bytes(b"not a snapshot")
+
+        app = AppSettingsSingleton(str(config), str(cache))
+
+        assert app.log_level == self.correct_config[self.log_level]
+
+    @pytest.mark.parametrize("snapshot, errors", [([], []), ("snapshot", []), (None, []), ({}, []), (True, "errors")])
+    def test_malformed_snapshot_cache_with_matching_key_is_ignored(self, tmp_path, snapshot, errors):
+        config = tmp_path / "appsettings.json"
+        cache = tmp_path / "appsettings.snapshot"
+        config.write_text(json.dumps(self.correct_config))
+        AppSettingsSingleton(str(config), str(cache))
+        AppSettingsSingleton.delete_instance_for_tests()
+
+        content = json.loads(cache.read_text())
+        content.update(snapshot=snapshot, errors=errors)
+        cache.write_text(json.dumps(content))
+        app = AppSettingsSingleton(str(config), str(cache))
+
+        assert app.retry_limit == self.correct_config[self.retry_limit]
+
+    def test_snapshot_cache_is_plain_json_and_never_unpickled(self, tmp_path):
+        config = tmp_path / "appsettings.json"
+        cache = tmp_path / "appsettings.snapshot"
+        marker = tmp_path / "unpickled"
+        config.write_text(json.dumps(self.correct_config))
+        cache.write_bytes(pickle.dumps(_CreateFileOnUnpickle(str(marker))))
+
+        AppSettingsSingleton(str(config), str(cache))
+
+        assert not marker.exists()
+        assert json.loads(cache.read_text())["snapshot"]["retry_limit"] == self.correct_config[self.retry_limit]
+
+    def test_validation_errors_are_reported(self, monkeypatch):
+        monkeypatch.setattr(os.path, 'isfile', lambda x: True)
+        monkeypatch.setattr(LoadFileContent, "load_json", lambda x: self.wrong_type)
+
+        app = AppSettingsSingleton("incorrect_type_config")
+
+        assert len(app.validation_errors) == len(self.wrong_type)
+
+    def test_validate_configs_in_bulk(self):
+        results = AppSettingsSingleton.validate_configs([self.correct_config, self.above_max, {}])
+
+        assert [snapshot.retry_limit for snapshot, _ in results] == [10, 100, 5]
+        assert [len(errors) for _, errors in results] == [0, 2, 0]
+
     def _assert_defaults(self, app):
         assert self.default_source_directory == app.source_directory
         assert self.default_failure_folder == app.failure_folder
@@ -0,0 +1,46 @@
+import os
+import pytest
+
+from CompactPathList import CompactPathList
+
+
+class TestCompactPathList(object):
+    paths = [
+        os.path.join("/Users/admin/downloads/fooDir", "bar.txt"),
+        os.path.join("/Users/admin/downloads/fooDir", "fooBar.avi"),
+        os.path.join("/Users/admin/downloads/tooDir", "Big.MP4"),
+        os.path.join("/Users/admin/downloads/pinDir", "pin1.mkv"),
+        os.path.join("/Users/admin/downloads/pinDir", "pin1.mkv"),
+    ]
+
+    def test_round_trips_paths(self):
+        compact_paths = CompactPathList(self.paths)
+
+        assert len(compact_paths) == 5
+        assert list(compact_paths) == self.paths
+        assert compact_paths[2] == self.paths[2]
+        assert compact_paths[-1] == self.paths[-1]
+        assert compact_paths.paths_at([1, 3]) == [self.paths[1], self.paths[3]]
+
+    def test_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            CompactPathList(self.paths)[5]
+
+    def test_directories_are_shared(self):
+        compact_paths = CompactPathList(self.paths)
+
+        assert len(compact_paths._directories) == 3
+        assert compact_paths.directory(4) is compact_paths.directory(3)
+
+    def test_files_of_specific_types(self):
+        compact_paths = CompactPathList(self.paths)
+
+        assert list(compact_paths.files_of_specific_types(["avi", "mp4"])) == self.paths[1:3]
+        assert len(list(compact_paths.files_of_specific_types([".MKV"]))) == 2
+
+    def test_non_utf8_names_round_trip(self):
+        name = os.fsdecode(b"clip\xff.mkv")
+        compact_paths = CompactPathList()
+        compact_paths.add("/media", name)
+
+        assert compact_paths[0] == os.path.join("/media", name)
@@ -0,0 +1,98 @@
+import logging
+import os
+import pytest
+
+import Deduplicator as Deduplicator_module
+from Deduplicator import Deduplicator
+from FileRecord import FileRecord
+
+
+@pytest.fixture(autouse=True, scope="class")
+def setup():
+    logging.disable(logging.CRITICAL)
+
+
+class TestDeduplicator(object):
+
+    @staticmethod
+    def _write(directory, name, content):
+        path = directory / name
+        path.write_bytes(content)
+        return str(path)
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_groups_identical_files(self, tmp_path, workers):
+        big = bytes(range(256)) * 64
+        pin = [self._write(tmp_path, "pin{0}.mkv".format(number), big) for number in range(3)]
+        middle_differs = self._write(tmp_path, "middle.mkv", big[:8000] + b"x" + big[8001:])
+        small = [self._write(tmp_path, "small{0}.avi".format(number), b"tiny") for number in range(2)]
+        self._write(tmp_path, "other.avi", b"ting")
+        self._write(tmp_path, "empty.mp4", b"")
+
+        duplicates = Deduplicator(workers=workers, block_size=1024).find_duplicates(
+            [str(path) for path in sorted(tmp_path.iterdir())]
+        )
+
+        assert sorted(map(sorted, duplicates)) == [sorted(pin), sorted(small)]
+        assert middle_differs not in sum(duplicates, [])
+
+    def test_unique_files_keeps_first_copy(self, tmp_path):
+        first = self._write(tmp_path, "a.mkv", b"same")
+        self._write(tmp_path, "b.mkv", b"same")
+        other = self._write(tmp_path, "c.mkv", b"diff")
+        records = [FileRecord(path, 4, 0.0, 0) for path in (first, str(tmp_path / "b.mkv"), other)]
+
+        assert list(Deduplicator(workers=0).unique_files(records)) == [first, other]
+
+    def test_repeated_paths_and_hard_links_are_one_file(self, tmp_path):
+        first = self._write(tmp_path, "a.mkv", b"same")
+        link = str(tmp_path / "link.mkv")
+        os.link(first, link)
+        copy = self._write(tmp_path, "b.mkv", b"same")
+        deduplicator = Deduplicator(workers=0)
+
+        assert list(deduplicator.unique_files([first, first])) == [first]
+        assert list(deduplicator.unique_files([first, link, first, copy])) == [first]
+        assert deduplicator.find_duplicates([first, first, link]) == []
+        assert deduplicator.find_duplicates([first, link, copy]) == [[first, copy]]
+
+    def test_hard_linked_records_are_one_file(self, tmp_path):
+        first = self._write(tmp_path, "a.mkv", b"same")
+        os.link(first, str(tmp_path / "link.mkv"))
+        copy = self._write(tmp_path, "b.mkv", b"same")
+        with os.scandir(str(tmp_path)) as entries:
+            records = sorted((FileRecord.from_dir_entry(entry) for entry in entries), key=lambda record: record.path)
+
+        assert list(Deduplicator(workers=0).unique_files(records)) == [first]
+        assert Deduplicator(workers=0).find_duplicates(records) == [[first, copy]]
+
+    def test_hashes_are_submitted_in_one_batch_per_stage(self, tmp_path, monkeypatch):
+        batches = []
+
+        class RecordingExecutor(object):
+            def __init__(self, max_workers=None):
+                pass
+
+            def map(self, function, *iterables):
+                arguments = list(zip(*iterables))
+                batches.append((function.__name__, len(arguments)))
+                return [function(*argument) for argument in arguments]
+
+            def shutdown(self):
+                pass
+
+        monkeypatch.setattr(Deduplicator_module, "ProcessPoolExecutor", RecordingExecutor)
+        big = bytes(range(256)) * 64
+        files = [self._write(tmp_path, "big{0}.mkv".format(number), big + bytes([number // 2])) for number in range(4)]
+        files += [self._write(tmp_path, "small{0}.avi".format(number), bytes([number // 2]) * 3) for number in range(4)]
+
+        duplicates = Deduplicator(workers=4, block_size=1024).find_duplicates(files)
+
+        assert batches == [("_partial_hash", 8), ("_full_hash", 4)]
+        assert sorted(duplicates) == [files[0:2], files[2:4], files[4:6], files[6:8]]
+
+    def test_missing_files_are_ignored(self, tmp_path):
+        first = self._write(tmp_path, "a.mkv", b"same")
+        records = [FileRecord(first, 4, 0.0, 0), FileRecord(str(tmp_path / "gone.mkv"), 4, 0.0, 0)]
+
+        assert Deduplicator(workers=0).find_duplicates(records) == []
@@ -49,3 +49,66 @@ class TestVFileFinder(object):
         video_finder = FileFinder().find_all_files_in_directory("directory")
         video_files = video_finder.get_files_of_specific_types(self.vid_ext)
         assert len(video_files) == 12
+
+    def test_stream_asked_to_search_nonexistent_dir(self, monkeypatch):
+        monkeypatch.setattr(os.path, 'isdir', lambda x: False)
+        with pytest.raises(NotADirectoryError):
+            FileFinder().stream_files_of_specific_types("fake_directory", self.vid_ext)
+
+    def test_stream_finds_right_files(self, tmp_path):
+        files = ['fooDir/bar.txt', 'fooDir/fooBar.avi', 'binDir/boo.wmv', 'binDir/big.txt',
+                 'tooDir/Big.mp4', 'somDir/som.mkv', 'somDir/som.srt', 'pinDir/Sample/pin1.mkv', 'top.avi']
+        for file in files:
+            path = tmp_path.joinpath(file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+
+        video_files = FileFinder().stream_files_of_specific_types(str(tmp_path), self.vid_ext)
+        assert next(video_files).endswith(('.avi', '.wmv', '.mp4', '.mkv'))
+        assert len(list(video_files)) == 5
+
+    def test_parallel_walk_matches_serial_walk(self, tmp_path):
+        for directory in ('a/b/c', 'a/d', 'e'):
+            tmp_path.joinpath(directory).mkdir(parents=True)
+            for name in ('one.mkv', 'two.txt'):
+                tmp_path.joinpath(directory, name).touch()
+
+        serial = FileFinder().find_all_files_in_directory(str(tmp_path))
+        ordered = FileFinder().find_all_files_in_directory(str(tmp_path), workers=4)
+        unordered = FileFinder().find_all_files_in_directory(str(tmp_path), workers=4, ordered=False)
+
+        expected = serial.get_files_of_specific_types(self.vid_ext)
+        assert len(expected) == 3
+        assert ordered.get_files_of_specific_types(self.vid_ext) == expected
+        assert sorted(unordered.get_files_of_specific_types(self.vid_ext)) == sorted(expected)
+
+    def test_extension_matching_is_case_insensitive(self, monkeypatch):
+        def mock_directory(walk_directory):
+            yield('/Users/admin/downloads', [], ['Big.MP4', 'small.mp4', 'clip.Mkv', 'notes.txt', 'mkv'])
+            yield('/Users/admin/downloads/archive', [], ['movies.tar.gz', 'other.gz'])
+
+        monkeypatch.setattr(os.path, 'isdir', lambda x: True)
+        monkeypatch.setattr(DirectoryWalker, 'walk_directory', mock_directory)
+
+        video_finder = FileFinder().find_all_files_in_directory("directory")
+        assert video_finder.get_files_of_specific_types(["mp4"]) == [
+            '/Users/admin/downloads/Big.MP4', '/Users/admin/downloads/small.mp4'
+        ]
+        assert len(video_finder.get_files_of_specific_types(self.vid_ext)) == 3
+        assert len(video_finder.get_files_of_specific_types([".MKV", "mkv"])) == 1
+        assert video_finder.get_files_of_specific_types(["tar.gz"]) == ['/Users/admin/downloads/archive/movies.tar.gz']
+        assert video_finder.get_files_of_specific_types(["avi"]) == []
+
+    def test_stream_with_metadata(self, tmp_path):
+        tmp_path.joinpath('clip.mkv').write_text('12345')
+        tmp_path.joinpath('notes.txt').write_text('ignored')
+
+        records = list(FileFinder().stream_files_of_specific_types(str(tmp_path), self.vid_ext, with_metadata=True))
+
+        stat = os.stat(tmp_path.joinpath('clip.mkv'))
+        assert len(records) == 1
+        assert records[0].path == str(tmp_path.joinpath('clip.mkv'))
+        assert records[0].size == 5
+        assert records[0].mtime == stat.st_mtime
+        assert records[0].inode == stat.st_ino
+        assert not hasattr(records[0], '__dict__')
@@ -0,0 +1,181 @@
+import json
+import os
+import pytest
+
+import FileLoader
+from FileLoader import LoadFileContent
+
+
+class TestLoadFileContent(object):
+    records = [dict(path="/media/clip{0}.mkv".format(number), size=number, tags=["a", "b"]) for number in range(500)]
+
+    @pytest.fixture(params=["orjson", "json"])
+    def backend(self, request, monkeypatch):
+        if request.param == "json":
+            monkeypatch.setattr(FileLoader, "orjson", None)
+        elif FileLoader.orjson is None:
+            pytest.skip("orjson is not installed")
+
+    def test_load_json(self, tmp_path, backend):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps(self.records))
+
+        assert LoadFileContent.load_json(str(manifest)) == self.records
+        assert LoadFileContent.load_json_mmap(str(manifest)) == self.records
+
+    def test_falls_back_to_json_for_non_standard_values(self, tmp_path, backend):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text('{"big": 123456789012345678901234567890, "missing": NaN}')
+
+        content = LoadFileContent.load_json_mmap(str(manifest))
+
+        assert content["big"] == 123456789012345678901234567890
+        assert content["missing"] != content["missing"]
+
+    def test_invalid_json_raises_json_decode_error(self, tmp_path, backend):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text('{"unterminated": ')
+
+        with pytest.raises(json.decoder.JSONDecodeError):
+            LoadFileContent.load_json(str(manifest))
+
+    def test_iter_json_lines(self, tmp_path, backend):
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text("\n".join(json.dumps(record) for record in self.records) + "\n\n")
+
+        assert list(LoadFileContent.iter_json_lines(str(manifest))) == self.records
+
+    def test_iter_json_array_across_chunk_boundaries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(LoadFileContent, "_STREAM_CHUNK_SIZE", 7)
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps(self.records + [12345, "tail"], indent=2))
+
+        assert list(LoadFileContent.iter_json_array(str(manifest))) == self.records + [12345, "tail"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 11])
+    def test_iter_json_array_splits_numbers_across_chunks(self, tmp_path, monkeypatch, chunk_size):
+        monkeypatch.setattr(LoadFileContent, "_STREAM_CHUNK_SIZE", chunk_size)
+        numbers = [1.25, 2.5, 3.125, 10.0625, 12.5, -6.02e23, 1.5E-7, 4e+10, 1234567, -0.0]
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text("[   " + ", ".join(repr(number) for number in numbers) + "]")
+
+        assert list(LoadFileContent.iter_json_array(str(manifest))) == numbers
+
+    def test_iter_json_array_long_whitespace_runs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(LoadFileContent, "_STREAM_CHUNK_SIZE", 7)
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(" " * 70000 + "[1," + " " * 30 + "2" + "\n" * 20 + "]" + " " * 30)
+
+        assert list(LoadFileContent.iter_json_array(str(manifest))) == [1, 2]
+
+    @pytest.mark.parametrize("content", ["", "[]", " [ ] "])
+    def test_iter_json_array_empty(self, tmp_path, content):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(content)
+
+        if content:
+            assert list(LoadFileContent.iter_json_array(str(manifest))) == []
+        else:
+            with pytest.raises(json.decoder.JSONDecodeError):
+                list(LoadFileContent.iter_json_array(str(manifest)))
+
+    @pytest.mark.parametrize("content", ['{"a": 1}', '[1, 2', '[1 2]', '[1, 2,]', '[,]', '[1] x', '[] []', '   '])
+    def test_iter_json_array_invalid(self, tmp_path, content):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(content)
+
+        with pytest.raises(json.decoder.JSONDecodeError):
+            list(LoadFileContent.iter_json_array(str(manifest)))
+
+
+class TestLoadFileContentCache(object):
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        LoadFileContent.clear_cache()
+        LoadFileContent.configure_cache()
+        yield
+        LoadFileContent.clear_cache()
+        LoadFileContent.configure_cache()
+
+    @staticmethod
+    def _bump_mtime(path):
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    def test_hits_and_misses(self, tmp_path):
+        config = tmp_path / "config.json"
+        config.write_text('{"RetryLimit": 3}')
+
+        first = LoadFileContent.load_json_cached(str(config))
+        second = LoadFileContent.load_json_cached(str(config))
+
+        assert first is second
+        assert first["RetryLimit"] == 3
+        assert LoadFileContent.cache_info()[:3] == (1, 1, 0)
+
+    def test_invalidated_when_file_changes(self, tmp_path):
+        config = tmp_path / "config.json"
+        config.write_text('{"RetryLimit": 3}')
+        LoadFileContent.load_json_cached(str(config))
+
+        config.write_text('{"RetryLimit": 4}')
+        self._bump_mtime(config)
+
+        assert LoadFileContent.load_json_cached(str(config))["RetryLimit"] == 4
+        assert LoadFileContent.cache_info().misses == 2
+        assert LoadFileContent.cache_info().entries == 1
+
+    def test_cached_content_is_immutable(self, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text('{"files": [{"path": "a.mkv"}]}')
+
+        content = LoadFileContent.load_json_cached(str(manifest))
+
+        with pytest.raises(TypeError):
+            content["files"] = []
+        with pytest.raises(TypeError):
+            content["files"][0]["path"] = "b.mkv"
+        assert content["files"][0]["path"] == "a.mkv"
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        LoadFileContent.configure_cache(max_entries=2)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / "{0}.json".format(name)
+            path.write_text('"{0}"'.format(name))
+            paths.append(str(path))
+
+        LoadFileContent.load_json_cached(paths[0])
+        LoadFileContent.load_json_cached(paths[1])
+        LoadFileContent.load_json_cached(paths[0])
+        LoadFileContent.load_json_cached(paths[2])
+        LoadFileContent.load_json_cached(paths[0])
+        LoadFileContent.load_json_cached(paths[1])
+
+        assert LoadFileContent.cache_info()[:4] == (2, 4, 2, 2)
+
+    def test_entries_are_evicted_by_size(self, tmp_path):
+        LoadFileContent.configure_cache(max_bytes=10)
+        small, first, second = tmp_path / "small.json", tmp_path / "first.json", tmp_path / "second.json"
+        small.write_text('[1]')
+        first.write_text('[2, 3]')
+        second.write_text('[4, 5]')
+
+        for file in (small, first, second):
+            LoadFileContent.load_json_cached(str(file))
+
+        info = LoadFileContent.cache_info()
+        assert (info.entries, info.bytes, info.evictions) == (1, 6, 2)
+
+    def test_files_larger_than_cache_are_not_cached(self, tmp_path):
+        LoadFileContent.configure_cache(max_bytes=10)
+        small, large = tmp_path / "small.json", tmp_path / "large.json"
+        small.write_text('[1]')
+        large.write_text('[1, 2, 3, 4]')
+
+        LoadFileContent.load_json_cached(str(small))
+        assert LoadFileContent.load_json_cached(str(large)) == (1, 2, 3, 4)
+
+        info = LoadFileContent.cache_info()
+        assert (info.entries, info.bytes, info.evictions) == (1, 3, 0)
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+import threading
+import time
+import pytest
+
+from FileFinder import FileFinder
+from FileWatcher import FileWatcher
+
+
+@pytest.fixture(autouse=True, scope="class")
+def setup():
+    logging.disable(logging.CRITICAL)
+
+
+class TestFileWatcher(object):
+    vid_ext = ["avi", "wmv", "mp4", "mkv"]
+
+    @staticmethod
+    def _write_slowly(path, chunks, delay):
+        def write():
+            time.sleep(delay)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            for chunk in chunks:
+                with open(path, "a") as file:
+                    file.write(chunk)
+                time.sleep(delay)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        return writer
+
+    @staticmethod
+    def _first_file(watcher):
+        safety = threading.Timer(5, watcher.stop)
+        safety.start()
+        try:
+            for path in watcher:
+                return path
+        finally:
+            safety.cancel()
+
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    def test_emits_new_file_once_writing_settles(self, tmp_path, use_inotify):
+        (tmp_path / "ignored.txt").touch()
+        watcher = FileWatcher(str(tmp_path), self.vid_ext, settle_seconds=0.3, poll_interval=0.05,
+                              use_inotify=use_inotify)
+        video = tmp_path / "nested" / "new.mkv"
+        writer = self._write_slowly(video, ["part1", "part2", "part3"], 0.1)
+
+        assert self._first_file(watcher) == str(video)
+        writer.join()
+        assert video.read_text() == "part1part2part3"
+
+    def test_existing_files_are_not_emitted(self, tmp_path):
+        (tmp_path / "old.mkv").touch()
+        watcher = FileWatcher(str(tmp_path), self.vid_ext, settle_seconds=0.1, poll_interval=0.05)
+        writer = self._write_slowly(tmp_path / "new.avi", ["data"], 0.1)
+
+        assert self._first_file(watcher) == str(tmp_path / "new.avi")
+        writer.join()
+
+    def test_async_stream(self, tmp_path):
+        watcher = FileFinder().watch_files_of_specific_types(str(tmp_path), self.vid_ext, 0.1, 0.05)
+        writer = self._write_slowly(tmp_path / "new.mp4", ["data"], 0.1)
+
+        async def first_file():
+            async for path in watcher.watch_async():
+                watcher.stop()
+                return path
+
+        assert asyncio.run(asyncio.wait_for(first_file(), 5)) == str(tmp_path / "new.mp4")
+        writer.join()
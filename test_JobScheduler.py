@@ -0,0 +1,92 @@
+import logging
+import os
+import threading
+import time
+import pytest
+
+from JobScheduler import JobScheduler
+
+
+@pytest.fixture(autouse=True, scope="class")
+def setup():
+    logging.disable(logging.CRITICAL)
+
+
+class FakeSettings:
+    retry_limit = 2
+    retry_wait_ms = 10
+    delete_processed = True
+
+    def __init__(self, failure_folder):
+        self.failure_folder = failure_folder
+
+
+class TestJobScheduler(object):
+
+    @staticmethod
+    def _make_files(directory, names):
+        paths = []
+        for name in names:
+            path = directory / name
+            path.write_text(name)
+            paths.append(str(path))
+        return paths
+
+    def test_retries_then_succeeds(self, tmp_path):
+        attempts = {}
+        lock = threading.Lock()
+
+        def flaky(path):
+            with lock:
+                attempts[path] = attempts.get(path, 0) + 1
+                if attempts[path] < 3:
+                    raise IOError("busy")
+
+        files = self._make_files(tmp_path, ["a.mkv", "b.mkv"])
+        results = JobScheduler(flaky, str(tmp_path / "failure"), retry_limit=2, retry_wait_ms=10).process_files(files)
+
+        assert sorted(results.processed) == files
+        assert results.failed == []
+        assert attempts == {files[0]: 3, files[1]: 3}
+        assert all(os.path.exists(path) for path in files)
+
+    def test_exhausted_retries_move_to_failure_folder(self, tmp_path):
+        def broken(path):
+            raise IOError("corrupt")
+
+        (tmp_path / "failure").mkdir()
+        (tmp_path / "failure" / "bad.mkv").write_text("earlier failure")
+        files = self._make_files(tmp_path, ["bad.mkv"])
+        results = JobScheduler(broken, str(tmp_path / "failure"), retry_limit=1, retry_wait_ms=0).process_files(files)
+
+        assert results.failed == files
+        assert not os.path.exists(files[0])
+        assert sorted(os.listdir(str(tmp_path / "failure"))) == ["bad (1).mkv", "bad.mkv"]
+
+    def test_settings_delete_processed_files(self, tmp_path):
+        files = self._make_files(tmp_path, ["a.mkv", "b.avi"])
+        scheduler = JobScheduler.from_settings(lambda path: None, FakeSettings(str(tmp_path / "failure")))
+
+        results = scheduler.process_files(files)
+
+        assert sorted(results.processed) == files
+        assert not any(os.path.exists(path) for path in files)
+
+    def test_retry_wait_does_not_block_other_jobs(self, tmp_path):
+        finished = []
+
+        def process(path):
+            if path.endswith("slow.mkv"):
+                raise IOError("busy")
+            time.sleep(0.05)
+            finished.append(path)
+
+        files = self._make_files(tmp_path, ["slow.mkv"] + ["fast{0}.mkv".format(number) for number in range(8)])
+        scheduler = JobScheduler(process, str(tmp_path / "failure"), workers=4, retry_limit=2, retry_wait_ms=300)
+
+        start = time.perf_counter()
+        results = scheduler.process_files(files)
+
+        assert time.perf_counter() - start < 1.5
+        assert len(results.processed) == 8
+        assert results.failed == [files[0]]
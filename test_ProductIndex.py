@@ -0,0 +1,81 @@
+import pytest
+
+from Specification import (
+    AndSpecification, Color, ColorSpecification, Filter, Price, Product, Size, SizeSpecification
+)
+from ProductIndex import ProductIndex
+from test_specification import PRODUCT_GRID, SPECIFICATIONS
+
+
+class TestProductIndex:
+    products = PRODUCT_GRID
+    specifications = SPECIFICATIONS
+
+    def test_bitmap_filter_matches_scanning(self):
+        index = ProductIndex(self.products)
+
+        for spec in self.specifications:
+            expected = Filter.filter(self.products, spec)
+
+            assert Filter.filter(index, spec) == expected
+            assert index.count(spec) == len(expected)
+
+    def test_delete_and_insert_maintain_bitmaps(self):
+        index = ProductIndex(self.products)
+        red = ColorSpecification(Color.RED)
+        removed = [product for product in self.products if product.size is Size.SMALL]
+
+        for product in removed:
+            index.remove(product)
+
+        assert len(index) == len(self.products) - len(removed)
+        assert removed[0] not in index
+        for spec in self.specifications:
+            remaining = [product for product in self.products if product not in removed]
+            assert index.filter(spec) == Filter.filter(remaining, spec)
+
+        apple = Product("Apple", Color.RED, Size.SMALL, Price.CHEAP)
+        row = index.insert(apple)
+
+        assert index.row_of(apple) == row
+        assert apple in index.filter(AndSpecification(red, SizeSpecification(Size.SMALL)))
+        assert index.delete(row) is apple
+        assert index.filter(AndSpecification(red, SizeSpecification(Size.SMALL))) == []
+
+    def test_delete_clears_the_values_indexed_at_insert(self):
+        index = ProductIndex(self.products[:2])
+        apple = Product("Apple", Color.RED, Size.SMALL, Price.CHEAP)
+        index.insert(apple)
+
+        apple.color = Color.GREEN
+        index.remove(apple)
+
+        assert index.filter(ColorSpecification(Color.RED)) == [
+            product for product in self.products[:2] if product.color is Color.RED
+        ]
+        assert index.filter(ColorSpecification(Color.GREEN)) == []
+
+    def test_filter_only_delegates_to_indexed_products(self):
+        class Catalog(list):
+            def filter(self, spec):
+                raise AssertionError("Filter must not call unrelated filter methods")
+
+        catalog = Catalog(self.products)
+
+        assert Filter.filter(catalog, ColorSpecification(Color.RED)) == [
+            product for product in self.products if product.color is Color.RED
+        ]
+
+    def test_invalid_updates_raise(self):
+        index = ProductIndex(self.products[:2])
+
+        with pytest.raises(ValueError):
+            index.insert(self.products[0])
+        with pytest.raises(ValueError):
+            index.remove(self.products[2])
+        with pytest.raises(KeyError):
+            index.delete(5)
+
+        index.delete(1)
+        with pytest.raises(KeyError):
+            index.delete(1)
@@ -0,0 +1,51 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Specification import Color, ColorSpecification, Filter, Price, Size
+from ProductTable import ProductTable
+from test_specification import PRODUCT_GRID, SPECIFICATIONS
+
+
+def describe(products):
+    return [(product.name, product.color, product.size, product.price) for product in products]
+
+
+class TestProductTable:
+    products = PRODUCT_GRID
+    specifications = SPECIFICATIONS
+
+    def test_table_round_trips_products(self):
+        table = ProductTable(self.products)
+
+        assert len(table) == len(self.products)
+        assert describe(table) == describe(self.products)
+        assert describe([table[7]]) == describe([self.products[7]])
+        assert table.colors.dtype == np.uint8
+
+    def test_vectorized_filter_matches_tree_walking(self):
+        table = ProductTable(self.products)
+
+        for spec in self.specifications:
+            expected = Filter.filter(self.products, spec)
+
+            assert describe(table.filter(spec)) == describe(expected)
+            assert table.count(spec) == len(expected)
+            assert table.mask(spec).dtype == bool
+
+    def test_append_and_extend_grow_columns(self):
+        table = ProductTable().append(self.products[0]).extend(self.products[1:3])
+
+        assert describe(table) == describe(self.products[:3])
+        assert table.indices(ColorSpecification(Color.RED)).tolist() == [0, 1, 2]
+
+    def test_from_columns(self):
+        table = ProductTable.from_columns(["Apple", "House"], [1, 3], [1, 4], [1, 4])
+
+        assert describe(table) == [
+            ("Apple", Color.RED, Size.SMALL, Price.CHEAP),
+            ("House", Color.BLUE, Size.HUGE, Price.VERY_EXPENSIVE),
+        ]
+
+        with pytest.raises(ValueError):
+            ProductTable.from_columns(["Apple"], [1, 3], [1], [1])
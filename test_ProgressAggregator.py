@@ -0,0 +1,133 @@
+import asyncio
+import io
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+
+pytest.importorskip("termcolor")
+
+from ProgressAggregator import ProgressAggregator, increment_progress
+
+
+def _increment_in_child(amount):
+    for _ in range(amount):
+        increment_progress()
+    return amount
+
+
+def _increment_after_install(initializer, initargs, amount):
+    initializer(*initargs)
+    _increment_in_child(amount)
+
+
+class TestProgressAggregator(object):
+
+    def test_threads_use_separate_slots(self):
+        aggregator = ProgressAggregator(4000, stream=io.StringIO())
+        running = threading.Barrier(4)
+
+        def work():
+            for _ in range(1000):
+                aggregator.increment()
+            running.wait()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert aggregator.completed == 4000
+        assert aggregator.worker_counts() == [1000, 1000, 1000, 1000]
+
+    def test_finished_threads_release_their_slots(self):
+        aggregator = ProgressAggregator(100, slots=4, stream=io.StringIO())
+
+        for _ in range(100):
+            thread = threading.Thread(target=aggregator.increment)
+            thread.start()
+            thread.join()
+
+        assert aggregator.completed == 100
+        assert aggregator.worker_counts() == [100]
+
+    def test_asyncio_tasks_share_the_loop_thread_slot(self):
+        aggregator = ProgressAggregator(30, stream=io.StringIO())
+
+        async def task():
+            for _ in range(10):
+                aggregator.increment()
+                await asyncio.sleep(0)
+
+        async def run():
+            await asyncio.gather(*(task() for _ in range(3)))
+
+        asyncio.run(run())
+        assert aggregator.worker_counts() == [30]
+
+    def test_child_processes_update_shared_counters(self):
+        aggregator = ProgressAggregator(400, stream=io.StringIO())
+        initializer, initargs = aggregator.process_initializer()
+
+        with ProcessPoolExecutor(2, initializer=initializer, initargs=initargs) as executor:
+            assert sum(executor.map(_increment_in_child, [100] * 4)) == 400
+
+        assert aggregator.completed == 400
+        assert len(aggregator.worker_counts()) == 2
+
+    def test_recycled_worker_processes_release_their_slots(self):
+        context = multiprocessing.get_context("spawn")
+        aggregator = ProgressAggregator(600, slots=2, stream=io.StringIO(), context=context)
+        initializer, initargs = aggregator.process_initializer()
+
+        with ProcessPoolExecutor(1, mp_context=context, initializer=initializer,
+                                 initargs=initargs, max_tasks_per_child=1) as executor:
+            assert sum(executor.map(_increment_in_child, [100] * 6)) == 600
+
+        assert aggregator.completed == 600
+        assert len(aggregator.worker_counts()) <= 2
+
+    def test_exiting_processes_release_their_slots(self):
+        aggregator = ProgressAggregator(50, slots=1, stream=io.StringIO())
+        initializer, initargs = aggregator.process_initializer()
+
+        for _ in range(5):
+            child = multiprocessing.Process(target=_increment_after_install, args=(initializer, initargs, 10))
+            child.start()
+            child.join()
+            assert child.exitcode == 0
+
+        assert aggregator.worker_counts() == [50]
+
+    def test_slots_of_dead_processes_are_reclaimed(self):
+        aggregator = ProgressAggregator(10, slots=1, stream=io.StringIO())
+        initializer, initargs = aggregator.process_initializer()
+        child = multiprocessing.Process(target=time.sleep, args=(0,))
+        child.start()
+        child.join()
+        aggregator._slot_owners[0] = child.pid
+        aggregator._next_slot.value = 1
+
+        initializer(*initargs)
+        increment_progress(3)
+
+        assert aggregator.worker_counts() == [3]
+
+    def test_slots_are_bounded(self):
+        aggregator = ProgressAggregator(10, slots=1, stream=io.StringIO())
+        aggregator.counter()
+
+        with pytest.raises(RuntimeError):
+            aggregator.counter()
+
+    def test_renders_combined_bar_and_worker_sub_bars(self):
+        stream = io.StringIO()
+        with ProgressAggregator(10, show_workers=True, stream=stream, interval=60) as aggregator:
+            aggregator.counter().increment(4)
+            aggregator.counter().increment(6)
+
+        output = stream.getvalue()
+        assert "100.0% Completed" in output
+        assert "Worker   0" in output and "Worker   1" in output
@@ -0,0 +1,173 @@
+import io
+import pytest
+
+pytest.importorskip("termcolor")
+
+from ProgressBar import ProgressBar, ProgressIterator
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProgressBar(object):
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr("ProgressBar.monotonic", clock)
+        return clock
+
+    def test_update_throttles_redraws(self, clock):
+        stream = io.StringIO()
+        bar = ProgressBar(1001, stream=stream, min_interval=1.0)
+
+        for i in range(1001):
+            bar.update(i)
+        redraws = stream.getvalue().count("Completed")
+        bar.finish()
+
+        assert redraws == 2
+        assert stream.getvalue().count("Completed") == 2
+
+    def test_update_redraws_on_percent_steps(self, clock):
+        stream = io.StringIO()
+        bar = ProgressBar(101, stream=stream, min_interval=0, min_percent_delta=10)
+
+        for i in range(101):
+            bar.update(i)
+
+        assert stream.getvalue().count("Completed") == 11
+        assert "100.0% Completed" in stream.getvalue().rpartition("\r")[2]
+
+    def test_update_redraws_once_the_interval_passes(self, clock):
+        stream = io.StringIO()
+        bar = ProgressBar(1001, stream=stream, min_interval=1.0, min_percent_delta=0.1)
+
+        bar.update(1)
+        bar.update(2)
+        clock.now += 1
+        bar.update(3)
+
+        assert stream.getvalue().count("Completed") == 2
+
+    def test_finish_always_redraws_the_last_state(self, clock):
+        stream = io.StringIO()
+        bar = ProgressBar(1001, stream=stream, min_interval=60)
+
+        bar.update(0)
+        bar.update(500)
+        bar.finish()
+
+        assert stream.getvalue().count("Completed") == 2
+        assert "100.0% Completed" in stream.getvalue()
+
+    def test_legacy_print_progress_is_unchanged(self, capsys):
+        ProgressBar(11, length=10).calculate_progress(5).print_progress()
+
+        assert "[█████-----] 50.0% Completed" in capsys.readouterr().out
+
+    def test_slow_progress_refreshes_metrics_on_time(self, clock):
+        snapshots = []
+        bar = ProgressBar(1000000, stream=io.StringIO(), on_metrics=snapshots.append)
+
+        for i in range(999):
+            clock.now += 1
+            bar.update(i)
+
+        assert len(snapshots) >= 998
+        assert snapshots[-1].elapsed_seconds == 999
+        assert snapshots[-1].items_per_second == pytest.approx(1.0)
+
+    def test_metrics_rates_and_eta(self, clock):
+        snapshots = []
+        bar = ProgressBar(101, stream=io.StringIO(), min_interval=0, smoothing=0.5, on_metrics=snapshots.append)
+
+        clock.now += 10
+        bar.update(20, completed_bytes=2048)
+        clock.now += 10
+        bar.update(60, completed_bytes=4096)
+
+        metrics = bar.metrics()
+        assert len(snapshots) == 2
+        assert (metrics.completed, metrics.total) == (61, 101)
+        assert metrics.elapsed_seconds == 20
+        assert metrics.items_per_second == pytest.approx(3.0)
+        assert metrics.bytes_per_second == pytest.approx(204.8)
+        assert metrics.eta_seconds == pytest.approx(40 / 3.0)
+
+    def test_metrics_report_item_counts(self, clock):
+        bar = ProgressBar(100, stream=io.StringIO(), min_interval=0)
+        assert (bar.metrics().completed, bar.metrics().percent) == (0, 0.0)
+
+        clock.now += 1
+        bar.finish()
+
+        metrics = bar.metrics()
+        assert (metrics.completed, metrics.total, metrics.percent, metrics.eta_seconds) == (100, 100, 100.0, 0.0)
+
+    def test_metrics_shown_on_the_line(self, clock):
+        stream = io.StringIO()
+        bar = ProgressBar(11, stream=stream, min_interval=0)
+
+        clock.now += 65
+        bar.update(5)
+
+        assert "0.1 it/s" in stream.getvalue()
+        assert "01:05 elapsed" in stream.getvalue()
+        assert "ETA 01:05" in stream.getvalue()
+
+    @pytest.mark.parametrize("total", [0, 1])
+    def test_tiny_totals_do_not_divide_by_zero(self, total):
+        bar = ProgressBar(total, stream=io.StringIO())
+
+        bar.calculate_progress(0)
+        assert bar.format_line(0).count("100.0%") == 1
+
+    def test_wraps_sized_iterable(self, clock):
+        stream = io.StringIO()
+
+        assert list(ProgressIterator(range(5), stream=stream)) == [0, 1, 2, 3, 4]
+        assert stream.getvalue().count("100.0% Completed") == 1
+
+    def test_wraps_generator_without_materializing(self, clock):
+        consumed = []
+        stream = io.StringIO()
+
+        def generate():
+            for number in range(3):
+                consumed.append(number)
+                yield number
+
+        iterator = iter(ProgressIterator(generate(), stream=stream, min_interval=0))
+        assert next(iterator) == 0
+        assert consumed == [0]
+        assert next(iterator) == 1
+        assert "1 items" in stream.getvalue()
+
+        assert list(iterator) == [2]
+        assert "100.0% Completed" in stream.getvalue()
+
+    def test_switches_to_bar_once_total_is_known(self, clock):
+        stream = io.StringIO()
+        progress = ProgressIterator(iter(range(4)), stream=stream, min_interval=0)
+
+        for item in progress:
+            if item == 1:
+                assert "1 items" in stream.getvalue()
+                assert "Completed" not in stream.getvalue()
+                progress.set_total(4)
+                assert progress.bar.total == 4
+
+        assert "100.0% Completed" in stream.getvalue()
+
+    def test_empty_iterable(self):
+        stream = io.StringIO()
+
+        assert list(ProgressIterator(iter([]), stream=stream)) == []
+        assert "100.0% Completed" in stream.getvalue()
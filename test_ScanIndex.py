@@ -0,0 +1,90 @@
+import logging
+import os
+import pytest
+
+from FileFinder import FileFinder
+from ScanIndex import ScanIndex
+
+
+@pytest.fixture(autouse=True, scope="class")
+def setup():
+    logging.disable(logging.CRITICAL)
+
+
+class TestScanIndex(object):
+
+    @staticmethod
+    def _touch(path, content=""):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    @staticmethod
+    def _bump_mtime(path):
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    def test_first_scan_reports_all_files_added(self, tmp_path):
+        self._touch(tmp_path / "media" / "a.mkv")
+        self._touch(tmp_path / "media" / "nested" / "b.avi")
+
+        with ScanIndex(str(tmp_path / "index.db")) as index:
+            delta = index.scan(str(tmp_path / "media"))
+
+        assert sorted(delta.added) == [str(tmp_path / "media" / "a.mkv"), str(tmp_path / "media" / "nested" / "b.avi")]
+        assert delta.removed == [] and delta.modified == []
+
+    def test_rescan_reports_delta(self, tmp_path):
+        media = tmp_path / "media"
+        self._touch(media / "keep.mkv")
+        self._touch(media / "change.mkv")
+        self._touch(media / "gone" / "old.avi")
+
+        with ScanIndex(str(tmp_path / "index.db")) as index:
+            index.scan(str(media))
+            assert not index.scan(str(media))
+
+            (media / "gone" / "old.avi").unlink()
+            (media / "gone").rmdir()
+            self._touch(media / "change.mkv", "new content")
+            self._touch(media / "new.mp4")
+            self._bump_mtime(media)
+            delta = index.scan(str(media))
+
+        assert delta.added == [str(media / "new.mp4")]
+        assert delta.removed == [str(media / "gone" / "old.avi")]
+        assert delta.modified == [str(media / "change.mkv")]
+
+    def test_index_persists_between_instances(self, tmp_path):
+        self._touch(tmp_path / "media" / "a.mkv")
+
+        with ScanIndex(str(tmp_path / "index.db")) as index:
+            index.scan(str(tmp_path / "media"))
+
+        with ScanIndex(str(tmp_path / "index.db")) as index:
+            assert not index.scan(str(tmp_path / "media"))
+            assert index.files(str(tmp_path / "media")) == [str(tmp_path / "media" / "a.mkv")]
+
+    def test_file_finder_uses_index(self, tmp_path):
+        self._touch(tmp_path / "media" / "a.mkv")
+        self._touch(tmp_path / "media" / "a.txt")
+
+        with ScanIndex(str(tmp_path / "index.db")) as index:
+            finder = FileFinder()
+            delta = finder.find_changes_in_directory(str(tmp_path / "media"), index)
+
+        assert len(delta.added) == 2
+        assert finder.get_files_of_specific_types(["mkv"]) == [str(tmp_path / "media" / "a.mkv")]
+
+    def test_scanning_subtree_then_parent_keeps_subtree_files(self, tmp_path):
+        media = tmp_path / "media"
+        self._touch(media / "sub" / "a.mkv")
+
+        with ScanIndex(str(tmp_path / "index.db")) as index:
+            index.scan(str(media / "sub"))
+            index.scan(str(media))
+            assert not index.scan(str(media))
+            assert index.files(str(media)) == [str(media / "sub" / "a.mkv")]
+
+            index.scan(str(media / "sub"))
+            assert not index.scan(str(media))
+            assert index.files(str(media)) == [str(media / "sub" / "a.mkv")]
@@ -0,0 +1,43 @@
+import pytest
+
+from SettingsSchema import Field, SettingsSchema, SettingsValidationError
+
+
+class TestSettingsSchema(object):
+    schema = SettingsSchema([
+        Field("Name", "name", str, "default"),
+        Field("Tags", "tags", list, ["a"], item_kind=str, convert=tuple),
+        Field("Count", "count", int, 5, minimum=0, maximum=10),
+        Field("Mode", "mode", str, "fast", choices=["fast", "slow"]),
+        Field("Enabled", "enabled", bool, False),
+    ])
+
+    def test_missing_values_use_defaults_without_errors(self):
+        values, errors = self.schema.validate({})
+
+        assert values == dict(name="default", tags=("a",), count=5, mode="fast", enabled=False)
+        assert errors == []
+
+    def test_all_errors_reported_in_one_pass(self):
+        values, errors = self.schema.validate(dict(Name=3, Tags=["ok", 4], Count=11, Mode="medium", Enabled=1))
+
+        assert values == dict(name="default", tags=("a",), count=10, mode="fast", enabled=False)
+        assert [error.split(":")[0] for error in errors] == ["Name", "Tags", "Count", "Mode", "Enabled"]
+
+    def test_bool_is_not_accepted_as_int(self):
+        values, errors = self.schema.validate(dict(Count=True))
+
+        assert values["count"] == 5
+        assert len(errors) == 1
+
+    def test_strict_raises_with_every_error(self):
+        with pytest.raises(SettingsValidationError) as error:
+            self.schema.validate(dict(Count=-1, Mode="medium"), strict=True)
+
+        assert len(error.value.errors) == 2
+
+    def test_validate_many(self):
+        results = self.schema.validate_many([dict(Count=3), dict(Count="3")])
+
+        assert [values["count"] for values, _ in results] == [3, 5]
+        assert [len(errors) for _, errors in results] == [0, 1]
@@ -0,0 +1,50 @@
+from Specification import (
+    AndSpecification, Color, ColorSpecification, Filter, OrSpecification, Price, PriceSpecification, Product, Size,
+    SizeSpecification
+)
+from SpecificationCompiler import SpecificationCompiler, compile_specification
+from test_specification import NamedSpecification, PRODUCT_GRID, SPECIFICATIONS
+
+
+class TestSpecificationCompiler:
+    products = PRODUCT_GRID
+    specifications = SPECIFICATIONS
+
+    def test_compiled_specification_matches_tree_walking(self):
+        for spec in self.specifications:
+            expected = Filter.filter(self.products, spec)
+
+            assert compile_specification(spec).filter(self.products) == expected
+            assert compile_specification(spec, self.products).filter(self.products) == expected
+            assert Filter.filter(self.products, compile_specification(spec, self.products)) == expected
+
+    def test_and_evaluates_most_selective_operand_first(self):
+        spec = AndSpecification(
+            AndSpecification(ColorSpecification(Color.RED), SizeSpecification(Size.LARGE)),
+            PriceSpecification(Price.CHEAP)
+        )
+        sample = [product for product in self.products if product.price is Price.CHEAP] + self.products
+
+        source = compile_specification(spec, sample).source
+
+        assert source.index("product.size") < source.index("product.color") < source.index("product.price")
+
+    def test_or_evaluates_least_selective_operand_first(self):
+        spec = OrSpecification(SizeSpecification(Size.SMALL), ColorSpecification(Color.RED))
+
+        source = compile_specification(spec, self.products).source
+
+        assert source.index("product.color") < source.index("product.size")
+
+    def test_unknown_specifications_are_called_directly(self):
+        spec = AndSpecification(ColorSpecification(Color.RED), NamedSpecification("Apple"))
+        products = [
+            Product("Apple", Color.RED, Size.SMALL, Price.CHEAP),
+            Product("Car", Color.RED, Size.LARGE, Price.EXPENSIVE),
+        ]
+
+        compiled = SpecificationCompiler(products).compile(spec)
+
+        assert compiled.filter(products) == products[:1]
+        assert compiled.specification(products[0])
+        assert not compiled.specification(products[1])
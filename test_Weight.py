@@ -1,3 +1,6 @@
+from decimal import Decimal
+from fractions import Fraction
+
 import pytest
 
 from Weight import Weight, WeightUnit
@@ -10,7 +13,7 @@ class TestWeight:
         (Weight(10, WeightUnit.G), Weight(10, WeightUnit.G), 20),
         (Weight(1, WeightUnit.KG), Weight(10, WeightUnit.G), 1.01),
         (Weight(10, WeightUnit.KG), Weight(10, WeightUnit.LB), 14.53592),
-        (10, Weight(10, WeightUnit.LB), 10.022046244201839)
+        (10, Weight(10, WeightUnit.LB), 10.022046244201837)
     ])
     def test_adding(self, weight1: Weight, weight2: Weight, expected_result: int):
         assert weight1 + weight2 == expected_result
@@ -37,3 +40,49 @@ class TestWeight:
         else:
             assert weight1 == expected_result
 
+    def test_repeated_accumulation_does_not_drift(self):
+        total = Weight(0, WeightUnit.LB)
+        for _ in range(1000):
+            total += Weight(0.1, WeightUnit.LB)
+        for _ in range(1000):
+            total -= Weight(0.1, WeightUnit.LB)
+
+        assert total.weight == 0
+        assert total == Weight(0, WeightUnit.KG)
+
+    def test_float_weights_are_stored_exactly(self):
+        assert Weight(0.1, WeightUnit.LB).weight == 0.1
+        assert type(Weight(0.1, WeightUnit.LB).micrograms) is int
+        assert Weight(0.0004, WeightUnit.G) != Weight(0, WeightUnit.G)
+
+        total = Weight(0, WeightUnit.LB)
+        for _ in range(1000):
+            total += Weight(0.1, WeightUnit.LB)
+
+        assert total.weight == 100
+        assert total == Weight(100, WeightUnit.LB)
+
+    def test_ordering_and_hashing_across_units(self):
+        weights = [Weight(1, WeightUnit.LB), Weight(1, WeightUnit.KG), Weight(10, WeightUnit.G)]
+
+        assert [weight.weight_unit for weight in sorted(weights)] == [WeightUnit.G, WeightUnit.LB, WeightUnit.KG]
+        assert Weight(1, WeightUnit.KG) == Weight(1000, WeightUnit.G)
+        assert Weight(1, WeightUnit.KG) >= Weight(1000, WeightUnit.G)
+        assert len({Weight(1, WeightUnit.KG), Weight(1000, WeightUnit.G), Weight(1, WeightUnit.LB)}) == 2
+
+    def test_exact_fraction_mode(self):
+        third = Weight(Fraction(1, 3), WeightUnit.LB)
+
+        assert type(third.weight) is Fraction
+        total = third
+        total += third
+        total += third
+        assert total.weight == 1
+        assert Weight(Decimal("0.0001"), WeightUnit.G).milligrams == Fraction(1, 10)
+
+    def test_convert_and_slots(self):
+        weight = Weight(1, WeightUnit.KG).convert(WeightUnit.G)
+
+        assert weight.weight == 1000
+        assert weight.weight_unit is WeightUnit.G
+        assert not hasattr(weight, "__dict__")
@@ -0,0 +1,101 @@
+import random
+import pytest
+
+from Weight import Weight, WeightUnit
+from WeightAggregator import QuantileSketch, WeightAggregator
+
+
+class TestWeightAggregator:
+
+    records = [
+        ("route-1", 1, WeightUnit.KG),
+        ("route-1", 500, WeightUnit.G),
+        ("route-1", 2, WeightUnit.LB),
+        ("route-2", 10, WeightUnit.KG),
+    ]
+
+    def test_grouped_sum_count_min_max(self):
+        aggregator = WeightAggregator(WeightUnit.KG).consume(iter(self.records))
+
+        route = aggregator["route-1"]
+        assert len(aggregator) == 2
+        assert route.count == 3
+        assert route.sum == Weight(2.407184, WeightUnit.KG)
+        assert route.sum.weight_unit is WeightUnit.KG
+        assert route.min == Weight(500, WeightUnit.G)
+        assert route.max == Weight(1, WeightUnit.KG)
+        assert route.mean.weight == pytest.approx(2.407184 / 3)
+        assert aggregator["route-2"].sum.weight == 10
+
+    def test_approximate_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.uniform(0.1, 50) for _ in range(20000)]
+        aggregator = WeightAggregator(WeightUnit.KG, relative_accuracy=0.01)
+        aggregator.consume(("hub", value, WeightUnit.KG) for value in values)
+
+        ordered = sorted(values)
+        for quantile in (0.0, 0.5, 0.9, 0.99, 1.0):
+            expected = ordered[int(quantile * (len(ordered) - 1))]
+            assert aggregator["hub"].quantile(quantile).weight == pytest.approx(expected, rel=0.011)
+        assert aggregator["hub"].sketch.bucket_count < 1000
+
+    def test_merge_matches_single_pass(self):
+        single = WeightAggregator().consume(self.records)
+        merged = WeightAggregator().consume(self.records[:2]).merge(WeightAggregator().consume(self.records[2:]))
+
+        for key in single.keys():
+            assert merged[key].count == single[key].count
+            assert merged[key].sum == single[key].sum
+            assert merged[key].min == single[key].min
+            assert merged[key].max == single[key].max
+            assert merged[key].quantile(0.5) == single[key].quantile(0.5)
+
+    def test_aggregate_in_parallel(self):
+        chunks = [self.records[:1], self.records[1:3], self.records[3:]]
+
+        aggregator = WeightAggregator.aggregate_in_parallel(chunks, WeightUnit.G, workers=2)
+
+        assert aggregator["route-1"].sum == Weight(2407.184, WeightUnit.G)
+        assert aggregator["route-2"].count == 1
+
+    def test_aggregate_in_parallel_bounds_pending_chunks(self):
+        merged = []
+
+        class CountingAggregator(WeightAggregator):
+            def merge(self, other):
+                merged.append(other)
+                return super().merge(other)
+
+        def chunks():
+            for _ in range(20):
+                assert pulled[0] - len(merged) <= 2
+                pulled[0] += 1
+                yield self.records
+
+        pulled = [0]
+        aggregator = CountingAggregator.aggregate_in_parallel(chunks(), WeightUnit.G, workers=1)
+
+        assert aggregator["route-1"].count == 60
+        assert len(merged) == 20
+
+    def test_float_records_keep_integer_totals(self):
+        aggregator = WeightAggregator(WeightUnit.LB).consume(("box", 0.1, WeightUnit.LB) for _ in range(1000))
+
+        assert type(aggregator["box"].total_micrograms) is int
+        assert aggregator["box"].sum == Weight(100, WeightUnit.LB)
+        assert type(aggregator["box"].quantile(0.5).micrograms) is int
+        assert aggregator["box"].mean == Weight(0.1, WeightUnit.LB)
+
+    def test_sketch_handles_zero_and_negative_values(self):
+        sketch = QuantileSketch(0.01)
+        for value in (-10, 0, 10):
+            sketch.add(value)
+
+        assert sketch.quantile(0) == pytest.approx(-10, rel=0.01)
+        assert sketch.quantile(0.5) == 0
+        assert sketch.quantile(1) == pytest.approx(10, rel=0.01)
+        assert QuantileSketch().quantile(0.5) is None
+
+    def test_sketches_with_different_accuracy_cannot_merge(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
@@ -0,0 +1,79 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Weight import Weight, WeightUnit
+from WeightArray import WeightArray
+
+
+class TestWeightArray:
+
+    def test_stores_grams_and_keeps_display_unit(self):
+        weights = WeightArray([1, 2.5], WeightUnit.KG)
+
+        assert weights.grams.tolist() == [1000, 2500]
+        assert weights.weights.tolist() == [1, 2.5]
+        assert weights.weight_unit is WeightUnit.KG
+
+    @pytest.mark.parametrize("other, expected", [
+        (WeightArray([10, 20], WeightUnit.G), [1.01, 2.02]),
+        (Weight(10, WeightUnit.G), [1.01, 2.01]),
+        (10, [1.01, 2.01]),
+        (Weight(Fraction(1, 3), WeightUnit.KG), [4 / 3, 7 / 3]),
+        (Fraction(10), [1.01, 2.01]),
+        (Decimal("10"), [1.01, 2.01]),
+        (np.float64(10), [1.01, 2.01]),
+    ])
+    def test_adding_keeps_unit(self, other, expected):
+        result = WeightArray([1, 2], WeightUnit.KG) + other
+
+        assert type(result) is WeightArray
+        assert result.grams.dtype == np.float64
+        assert result.weight_unit is WeightUnit.KG
+        assert result.weights == pytest.approx(expected)
+
+    def test_subtracting_mixed_units(self):
+        result = WeightArray([10], WeightUnit.KG) - WeightArray([10], WeightUnit.LB)
+        reversed_result = 10000 - WeightArray([10], WeightUnit.LB)
+
+        assert result.weights == pytest.approx([5.46408])
+        assert reversed_result.convert(WeightUnit.KG).weights == pytest.approx([5.46408])
+
+    def test_sum_mean_and_convert(self):
+        weights = WeightArray([1, 2, 3], WeightUnit.KG)
+
+        assert weights.sum().weight == pytest.approx(6)
+        assert weights.sum().weight_unit is WeightUnit.KG
+        assert weights.mean().weight == pytest.approx(2)
+        assert weights.convert(WeightUnit.G).sum().weight == pytest.approx(6000)
+
+    def test_mean_of_empty_array(self):
+        with pytest.raises(ArithmeticError):
+            WeightArray([]).mean()
+
+    def test_comparisons_between_mixed_units(self):
+        kilograms = WeightArray([1, 0.4, 0.4535], WeightUnit.KG)
+        pounds = WeightArray([1, 1, 1], WeightUnit.LB)
+
+        assert (kilograms > pounds).tolist() == [True, False, False]
+        assert (kilograms < Weight(500, WeightUnit.G)).tolist() == [False, True, True]
+
+    def test_indexing_and_iteration(self):
+        weights = WeightArray([1, 2, 3], WeightUnit.LB)
+
+        assert type(weights[0]) is Weight
+        assert weights[0].weight == 1 and weights[0].weight_unit is WeightUnit.LB
+        assert weights[weights > Weight(1, WeightUnit.KG)].weights == pytest.approx([3])
+        assert [weight.weight for weight in weights] == pytest.approx([1, 2, 3])
+
+    def test_from_weights(self):
+        weights = WeightArray.from_weights([Weight(1, WeightUnit.KG), Weight(10, WeightUnit.G)], WeightUnit.G)
+
+        assert weights.weights.tolist() == [1000, 10]
+
+    def test_invalid_operand(self):
+        with pytest.raises(ArithmeticError):
+            WeightArray([1]) + "1"
@@ -0,0 +1,61 @@
+import pytest
+
+from FileRecord import FileRecord
+from WorkQueue import SchedulingPolicy, WorkQueue
+
+
+class TestWorkQueue(object):
+    records = [
+        FileRecord("/drop/big/huge.mkv", 9000, 10.0, 1),
+        FileRecord("/drop/big/large.mkv", 5000, 30.0, 2),
+        FileRecord("/drop/big/medium.mkv", 3000, 40.0, 3),
+        FileRecord("/drop/small/a.avi", 10, 20.0, 4),
+        FileRecord("/drop/small/b.avi", 20, 50.0, 5),
+        FileRecord("/drop/other/c.mp4", 15, 5.0, 6),
+    ]
+
+    def test_shortest_job_first(self):
+        queue = WorkQueue(SchedulingPolicy.SHORTEST_JOB_FIRST, self.records)
+
+        assert [record.size for record in queue] == [10, 15, 20, 3000, 5000, 9000]
+        assert len(queue) == 0
+
+    def test_oldest_first(self):
+        queue = WorkQueue(SchedulingPolicy.OLDEST_FIRST, self.records)
+
+        assert [record.mtime for record in queue] == [5.0, 10.0, 20.0, 30.0, 40.0, 50.0]
+
+    def test_fair_share_rotates_directories(self):
+        queue = WorkQueue(SchedulingPolicy.FAIR_SHARE, self.records)
+
+        assert list(queue.paths()) == [
+            "/drop/big/medium.mkv", "/drop/small/a.avi", "/drop/other/c.mp4",
+            "/drop/big/large.mkv", "/drop/small/b.avi",
+            "/drop/big/huge.mkv",
+        ]
+
+    def test_fair_share_new_directory_does_not_jump_ahead_of_served_turns(self):
+        queue = WorkQueue(SchedulingPolicy.FAIR_SHARE, self.records[:3])
+        assert queue.pop().path == "/drop/big/medium.mkv"
+        assert queue.pop().path == "/drop/big/large.mkv"
+
+        queue.push(FileRecord("/drop/late/x.mkv", 1, 0.0, 7))
+        queue.push(FileRecord("/drop/late/y.mkv", 2, 0.0, 8))
+
+        assert list(queue.paths()) == ["/drop/late/x.mkv", "/drop/big/huge.mkv", "/drop/late/y.mkv"]
+
+    def test_fair_share_forgets_drained_directories(self):
+        queue = WorkQueue(SchedulingPolicy.FAIR_SHARE)
+
+        for number in range(10000):
+            queue.push(FileRecord("/drop/{0}/a.mkv".format(number), 1, 0.0, 0))
+            queue.push(FileRecord("/drop/{0}/b.mkv".format(number), 2, 0.0, 0))
+            queue.push(FileRecord("/drop/steady/{0}.mkv".format(number), 3, 0.0, 0))
+            for _ in range(3):
+                queue.pop()
+
+        assert len(queue._directory_turns) <= 2 * WorkQueue._PRUNE_TURNS_MINIMUM
+
+    def test_pop_from_empty_queue(self):
+        with pytest.raises(IndexError):
+            WorkQueue().pop()
@@ -1,4 +1,41 @@
-from Specification import Product, Color, Size, Price
+import itertools
+
+from Specification import (
+    AndSpecification, Color, ColorSpecification, OrSpecification, Price, PriceSpecification, Product, Size,
+    SizeSpecification, Specification, XorSpecification
+)
+
+
+class NamedSpecification(Specification):
+
+    def __init__(self, name):
+        self.name = name
+
+    def specification(self, product):
+        return product.name == self.name
+
+
+PRODUCT_GRID = [
+    Product("Item {0}".format(index), color, size, price)
+    for index, (color, size, price) in enumerate(itertools.product(Color, Size, Price))
+]
+
+SPECIFICATIONS = [
+    ColorSpecification(Color.RED),
+    AndSpecification(SizeSpecification(Size.LARGE), ColorSpecification(Color.RED)),
+    OrSpecification(PriceSpecification(Price.CHEAP), SizeSpecification(Size.SMALL)),
+    XorSpecification(SizeSpecification(Size.SMALL), ColorSpecification(Color.RED)),
+    OrSpecification(
+        AndSpecification(AndSpecification(SizeSpecification(Size.HUGE), PriceSpecification(Price.CHEAP)),
+                         ColorSpecification(Color.BLUE)),
+        XorSpecification(ColorSpecification(Color.GREEN), OrSpecification(
+            PriceSpecification(Price.EXPENSIVE), SizeSpecification(Size.MEDIUM)))
+    ),
+    OrSpecification(
+        AndSpecification(ColorSpecification(Color.BLUE), NamedSpecification("Item 5")),
+        XorSpecification(ColorSpecification(Color.GREEN), NamedSpecification("Item 20"))
+    ),
+]
 
 
 class TestSpecification: